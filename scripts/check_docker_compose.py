@@ -1,27 +1,42 @@
 #!/usr/bin/env python3
 """Script to check Docker Compose file against standardization templates."""
 
+import argparse
+import functools
 import sys
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Set
 
-import containers.scripts.yaml
+import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader
 
+from validators._cache import cached_pickle
+
+
+@functools.lru_cache(maxsize=1)
 def load_template() -> Dict:
-    """Load Docker Compose service template."""
+    """Load Docker Compose service template.
+
+    The parsed template is pickled to CACHE_DIR and reused while the
+    template file is unchanged. Within a process the result is also
+    memoized; call load_template.cache_clear() to force a reload.
+    """
     standards_dir = Path(__file__).parent.parent / "docs" / "standards"
     template_path = standards_dir / "docker" / "DOCKER_COMPOSE_SERVICE_TEMPLATE.yml"
     
-    with open(template_path) as f:
-        return yaml.safe_load(f)
+    def parse() -> Dict:
+        with open(template_path) as f:
+            return yaml.load(f.read(), Loader=SafeLoader)
+    
+    return cached_pickle("compose_template", [template_path], parse)
 
 
-def check_service_config(service_name: str, config: Dict, template: Dict) -> List[str]:
-    """Check if a service configuration follows the template standards."""
-    errors = []
-    
-    # Required top-level keys
+def _check_required_keys(service_name: str, config: Dict) -> Iterator[str]:
+    """Yield an error for each missing required top-level key."""
     required_keys = {
         "build",
         "environment",
@@ -29,56 +44,84 @@ def check_service_config(service_name: str, config: Dict, template: Dict) -> Lis
         "healthcheck"
     }
     
-    # Check required keys
-    for key in required_keys:
-        if key not in config:
-            errors.append(f"Service '{service_name}' is missing required key: {key}")
-    
-    # Check environment variables
-    if "environment" in config:
-        env_vars = set()
-        for env in config["environment"]:
-            if isinstance(env, str):
-                env_vars.add(env.split("=")[0])
-            elif isinstance(env, dict):
-                env_vars.update(env.keys())
-        
-        required_env_vars = {
-            "PYTHONPATH",
-            "ENV"
-        }
-        
-        for var in required_env_vars:
-            if var not in env_vars:
-                errors.append(f"Service '{service_name}' is missing required environment variable: {var}")
-    
-    # Check build configuration
-    if "build" in config:
-        if "context" not in config["build"]:
-            errors.append(f"Service '{service_name}' build is missing context")
-        if "dockerfile" not in config["build"]:
-            errors.append(f"Service '{service_name}' build is missing dockerfile path")
-    
-    # Check volumes
-    if "volumes" in config:
-        source_mounted = False
-        for volume in config["volumes"]:
-            if "/app" in volume:
-                source_mounted = True
-                break
-        if not source_mounted:
-            errors.append(f"Service '{service_name}' must mount source code to /app")
-    
-    # Check healthcheck
-    if "healthcheck" in config:
-        required_health_keys = {"test", "interval", "timeout", "retries"}
-        health_config = config["healthcheck"]
-        
-        for key in required_health_keys:
-            if key not in health_config:
-                errors.append(f"Service '{service_name}' healthcheck is missing: {key}")
+    for key in sorted(required_keys - set(config)):
+        yield f"Service '{service_name}' is missing required key: {key}"
+
+
+def _check_environment(service_name: str, config: Dict) -> Iterator[str]:
+    """Yield an error for each missing required environment variable."""
+    if "environment" not in config:
+        return
     
-    return errors
+    # Dispatch on the environment's shape once rather than per entry
+    environment = config["environment"]
+    if isinstance(environment, dict):
+        env_vars = set(environment)
+    else:
+        env_vars = {env.partition("=")[0] for env in environment if isinstance(env, str)}
+    
+    required_env_vars = {
+        "PYTHONPATH",
+        "ENV"
+    }
+    
+    for var in sorted(required_env_vars - env_vars):
+        yield f"Service '{service_name}' is missing required environment variable: {var}"
+
+
+def _check_build(service_name: str, config: Dict) -> Iterator[str]:
+    """Yield errors for an incomplete build configuration."""
+    if "build" not in config:
+        return
+    
+    if "context" not in config["build"]:
+        yield f"Service '{service_name}' build is missing context"
+    if "dockerfile" not in config["build"]:
+        yield f"Service '{service_name}' build is missing dockerfile path"
+
+
+def _check_volumes(service_name: str, config: Dict) -> Iterator[str]:
+    """Yield an error if the source code is not mounted to /app."""
+    if "volumes" not in config:
+        return
+    
+    source_mounted = any("/app" in volume for volume in config["volumes"])
+    if not source_mounted:
+        yield f"Service '{service_name}' must mount source code to /app"
+
+
+def _check_healthcheck(service_name: str, config: Dict) -> Iterator[str]:
+    """Yield an error for each missing healthcheck key."""
+    if "healthcheck" not in config:
+        return
+    
+    required_health_keys = {"test", "interval", "timeout", "retries"}
+    health_config = config["healthcheck"]
+    
+    for key in sorted(required_health_keys - set(health_config)):
+        yield f"Service '{service_name}' healthcheck is missing: {key}"
+
+
+def iter_service_config_errors(service_name: str, config: Dict, template: Dict) -> Iterator[str]:
+    """Lazily yield service configuration errors, in check order."""
+    yield from _check_required_keys(service_name, config)
+    yield from _check_environment(service_name, config)
+    yield from _check_build(service_name, config)
+    yield from _check_volumes(service_name, config)
+    yield from _check_healthcheck(service_name, config)
+
+
+def check_service_config(service_name: str, config: Dict, template: Dict,
+                         fast_fail: bool = False) -> List[str]:
+    """Check if a service configuration follows the template standards.
+
+    With fast_fail, stop at the first error instead of collecting them all.
+    """
+    errors = iter_service_config_errors(service_name, config, template)
+    if fast_fail:
+        error = next(errors, None)
+        return [error] if error is not None else []
+    return list(errors)
 
 
 def check_networks(compose_config: Dict) -> List[str]:
@@ -118,6 +161,11 @@ def check_dependencies(compose_config: Dict) -> List[str]:
 
 def main() -> int:
     """Main function to check Docker Compose configuration."""
+    parser = argparse.ArgumentParser(description="Check docker-compose.yml against standards")
+    parser.add_argument("--quick", action="store_true",
+                        help="Stop at the first error (exit code only matters)")
+    args = parser.parse_args()
+    
     try:
         template = load_template()
         compose_path = Path("docker-compose.yml")
@@ -127,7 +175,7 @@ def main() -> int:
             return 1
         
         with open(compose_path) as f:
-            compose_config = yaml.safe_load(f)
+            compose_config = yaml.load(f.read(), Loader=SafeLoader)
         
         if not compose_config or "services" not in compose_config:
             print("Error: Invalid docker-compose.yml format")
@@ -139,25 +187,33 @@ def main() -> int:
         network_errors = check_networks(compose_config)
         if network_errors:
             print("\nNetwork configuration errors:")
-            for error in network_errors:
+            for error in network_errors[:1] if args.quick else network_errors:
                 print(f"  - {error}")
+            if args.quick:
+                return 1
             exit_code = 1
         
         # Check dependencies
         dependency_errors = check_dependencies(compose_config)
         if dependency_errors:
             print("\nDependency configuration errors:")
-            for error in dependency_errors:
+            for error in dependency_errors[:1] if args.quick else dependency_errors:
                 print(f"  - {error}")
+            if args.quick:
+                return 1
             exit_code = 1
         
         # Check each service
         for service_name, config in compose_config["services"].items():
-            service_errors = check_service_config(service_name, config, template)
+            service_errors = check_service_config(
+                service_name, config, template, fast_fail=args.quick
+            )
             if service_errors:
                 print(f"\nErrors in service '{service_name}':")
                 for error in service_errors:
                     print(f"  - {error}")
+                if args.quick:
+                    return 1
                 exit_code = 1
         
         return exit_code
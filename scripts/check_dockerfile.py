@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
 """Script to check Dockerfile against standardization templates."""
 
+import mmap
+import os
 import re
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Set, Tuple, Union
+
+# One logical instruction: the keyword, then its argument including any
+# backslash-continued lines (comment lines may sit between continuations).
+# Patterns are bytes so the Dockerfile never needs a full UTF-8 decode.
+INSTRUCTION_RE = re.compile(
+    rb'^[ \t]*([A-Za-z]+)[ \t]+((?:.*\\[ \t]*\n(?:[ \t]*(?:#.*)?\n)*)*.*)$',
+    re.MULTILINE
+)
+CONTINUATION_RE = re.compile(rb'\\[ \t]*\n')
 
 
 def load_template() -> str:
@@ -16,38 +28,48 @@ def load_template() -> str:
         return f.read()
 
 
-def parse_dockerfile(content: str) -> List[Tuple[str, str]]:
-    """Parse Dockerfile content into a list of (instruction, argument) tuples."""
+def parse_dockerfile(content: Union[bytes, mmap.mmap]) -> List[Tuple[str, bytes]]:
+    """Parse Dockerfile content into a list of (instruction, argument) tuples.
+
+    Instruction names are decoded (they are ASCII letters); arguments stay
+    as bytes and are only decoded when they appear in an error message.
+    """
     instructions = []
-    current_instruction = None
-    current_args = []
     
-    for line in content.split("\n"):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        
-        if line.endswith("\\"):
-            if current_instruction is None:
-                instruction, arg = line.split(None, 1)
-                current_instruction = instruction
-                current_args = [arg.rstrip("\\").strip()]
-            else:
-                current_args.append(line.rstrip("\\").strip())
-        else:
-            if current_instruction is not None:
-                current_args.append(line)
-                instructions.append((current_instruction, " ".join(current_args)))
-                current_instruction = None
-                current_args = []
-            else:
-                instruction, arg = line.split(None, 1)
-                instructions.append((instruction, arg))
+    for match in INSTRUCTION_RE.finditer(content):
+        parts = []
+        for part in CONTINUATION_RE.split(match.group(2)):
+            for line in part.split(b"\n"):
+                line = line.strip()
+                if line and not line.startswith(b"#"):
+                    parts.append(line)
+        instructions.append((match.group(1).decode("ascii"), b" ".join(parts)))
     
     return instructions
 
 
-def check_base_image(instructions: List[Tuple[str, str]]) -> List[str]:
+def load_dockerfile(dockerfile_path: Path) -> List[Tuple[str, bytes]]:
+    """Memory-map a Dockerfile and parse it without decoding the whole file.
+
+    The map is closed as soon as parsing finishes; the parsed arguments
+    are independent copies.
+    """
+    with open(dockerfile_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_dockerfile(mm)
+
+
+def index_instructions(instructions: List[Tuple[str, bytes]]) -> Dict[str, List[bytes]]:
+    """Group instruction arguments by instruction name, preserving order."""
+    by_instruction = defaultdict(list)
+    for instruction, args in instructions:
+        by_instruction[instruction].append(args)
+    return by_instruction
+
+
+def check_base_image(instructions: List[Tuple[str, bytes]]) -> List[str]:
     """Check if the base image is correct."""
     errors = []
     
@@ -56,50 +78,48 @@ def check_base_image(instructions: List[Tuple[str, str]]) -> List[str]:
         return errors
     
     base_image = instructions[0][1]
-    if not base_image.startswith("python:3.11"):
+    if not base_image.startswith(b"python:3.11"):
         errors.append("Base image must be python:3.11")
     
     return errors
 
 
-def check_environment_variables(instructions: List[Tuple[str, str]]) -> List[str]:
+def check_environment_variables(by_instruction: Dict[str, List[bytes]]) -> List[str]:
     """Check if required environment variables are set."""
     errors = []
     required_env_vars = {
-        "PYTHONUNBUFFERED",
-        "PYTHONDONTWRITEBYTECODE",
-        "POETRY_VERSION",
-        "POETRY_HOME",
-        "POETRY_VIRTUALENVS_IN_PROJECT",
-        "POETRY_NO_INTERACTION",
-        "PYSETUP_PATH",
-        "VENV_PATH"
+        b"PYTHONUNBUFFERED",
+        b"PYTHONDONTWRITEBYTECODE",
+        b"POETRY_VERSION",
+        b"POETRY_HOME",
+        b"POETRY_VIRTUALENVS_IN_PROJECT",
+        b"POETRY_NO_INTERACTION",
+        b"PYSETUP_PATH",
+        b"VENV_PATH"
     }
     
     found_env_vars = set()
-    for instruction, args in instructions:
-        if instruction == "ENV":
-            # Handle both formats: ENV KEY=VALUE and ENV KEY VALUE
-            if "=" in args:
-                key = args.split("=")[0].strip()
-            else:
-                key = args.split()[0].strip()
-            found_env_vars.add(key)
-    
-    for var in required_env_vars:
-        if var not in found_env_vars:
-            errors.append(f"Missing required environment variable: {var}")
+    for args in by_instruction.get("ENV", []):
+        # Handle both formats: ENV KEY=VALUE and ENV KEY VALUE
+        if b"=" in args:
+            key = args.split(b"=")[0].strip()
+        else:
+            key = args.split()[0].strip()
+        found_env_vars.add(key)
+    
+    for var in sorted(required_env_vars - found_env_vars):
+        errors.append(f"Missing required environment variable: {var.decode()}")
     
     return errors
 
 
-def check_poetry_installation(instructions: List[Tuple[str, str]]) -> List[str]:
+def check_poetry_installation(by_instruction: Dict[str, List[bytes]]) -> List[str]:
     """Check if Poetry is installed correctly."""
     errors = []
     poetry_install_found = False
     
-    for instruction, args in instructions:
-        if instruction == "RUN" and "curl -sSL https://install.python-poetry.org" in args:
+    for args in by_instruction.get("RUN", []):
+        if b"curl -sSL https://install.python-poetry.org" in args:
             poetry_install_found = True
             break
     
@@ -109,17 +129,21 @@ def check_poetry_installation(instructions: List[Tuple[str, str]]) -> List[str]:
     return errors
 
 
-def check_dependencies_installation(instructions: List[Tuple[str, str]]) -> List[str]:
+def check_dependencies_installation(by_instruction: Dict[str, List[bytes]]) -> List[str]:
     """Check if dependencies are installed correctly."""
     errors = []
     poetry_install_found = False
     copy_requirements_found = False
     
-    for instruction, args in instructions:
-        if instruction == "COPY" and "pyproject.toml" in args and "poetry.lock" in args:
+    for args in by_instruction.get("COPY", []):
+        if b"pyproject.toml" in args and b"poetry.lock" in args:
             copy_requirements_found = True
-        elif instruction == "RUN" and "poetry install" in args:
+            break
+    
+    for args in by_instruction.get("RUN", []):
+        if b"poetry install" in args:
             poetry_install_found = True
+            break
     
     if not copy_requirements_found:
         errors.append("Must copy pyproject.toml and poetry.lock files")
@@ -129,17 +153,15 @@ def check_dependencies_installation(instructions: List[Tuple[str, str]]) -> List
     return errors
 
 
-def check_healthcheck(instructions: List[Tuple[str, str]]) -> List[str]:
+def check_healthcheck(by_instruction: Dict[str, List[bytes]]) -> List[str]:
     """Check if healthcheck is configured correctly."""
     errors = []
     healthcheck_found = False
     
-    for instruction, args in instructions:
-        if instruction == "HEALTHCHECK":
-            healthcheck_found = True
-            if "--interval" not in args or "--timeout" not in args or "--retries" not in args:
-                errors.append("Healthcheck must specify interval, timeout, and retries")
-            break
+    for args in by_instruction.get("HEALTHCHECK", [])[:1]:
+        healthcheck_found = True
+        if b"--interval" not in args or b"--timeout" not in args or b"--retries" not in args:
+            errors.append("Healthcheck must specify interval, timeout, and retries")
     
     if not healthcheck_found:
         errors.append("Healthcheck configuration not found")
@@ -147,21 +169,19 @@ def check_healthcheck(instructions: List[Tuple[str, str]]) -> List[str]:
     return errors
 
 
-def check_labels(instructions: List[Tuple[str, str]]) -> List[str]:
+def check_labels(by_instruction: Dict[str, List[bytes]]) -> List[str]:
     """Check if required labels are present."""
     errors = []
-    required_labels = {"maintainer", "version", "description"}
+    required_labels = {b"maintainer", b"version", b"description"}
     found_labels = set()
     
-    for instruction, args in instructions:
-        if instruction == "LABEL":
-            for label in args.split():
-                if "=" in label:
-                    found_labels.add(label.split("=")[0].strip())
+    for args in by_instruction.get("LABEL", []):
+        for label in args.split():
+            if b"=" in label:
+                found_labels.add(label.split(b"=")[0].strip())
     
-    for label in required_labels:
-        if label not in found_labels:
-            errors.append(f"Missing required label: {label}")
+    for label in sorted(required_labels - found_labels):
+        errors.append(f"Missing required label: {label.decode()}")
     
     return errors
 
@@ -176,24 +196,22 @@ def main() -> int:
             print("Error: Dockerfile not found")
             return 1
         
-        with open(dockerfile_path) as f:
-            content = f.read()
-        
-        instructions = parse_dockerfile(content)
+        instructions = load_dockerfile(dockerfile_path)
+        by_instruction = index_instructions(instructions)
         exit_code = 0
         
-        # Run all checks
+        # Run all checks; only the base image check needs instruction order
         checks = [
-            ("Base image", check_base_image),
-            ("Environment variables", check_environment_variables),
-            ("Poetry installation", check_poetry_installation),
-            ("Dependencies installation", check_dependencies_installation),
-            ("Healthcheck", check_healthcheck),
-            ("Labels", check_labels)
+            ("Base image", check_base_image, instructions),
+            ("Environment variables", check_environment_variables, by_instruction),
+            ("Poetry installation", check_poetry_installation, by_instruction),
+            ("Dependencies installation", check_dependencies_installation, by_instruction),
+            ("Healthcheck", check_healthcheck, by_instruction),
+            ("Labels", check_labels, by_instruction)
         ]
         
-        for check_name, check_func in checks:
-            errors = check_func(instructions)
+        for check_name, check_func, check_input in checks:
+            errors = check_func(check_input)
             if errors:
                 print(f"\n{check_name} errors:")
                 for error in errors:
@@ -1,23 +1,44 @@
 #!/usr/bin/env python3
 
 import argparse
+import io
+import itertools
+import mmap
 import os
 import re
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import List, Tuple
 
 class EnvSecretChecker:
     def __init__(self):
-        # Patterns to identify potential secrets/configuration
+        # Patterns to identify potential secrets/configuration. Each pattern
+        # captures its value in a group named after the pattern type so they
+        # can be fused into a single bytes regex that scans a whole file in
+        # one pass. Separators use [^\S\n] so a match never spans lines.
         self.patterns = {
-            'port': r'(?:^|\s|=)(\d{2,5})(?:\s|$|:)',  # Matches potential port numbers
-            'password': r'(?i)(?:password|passwd|pwd)[\s]*[=:]\s*["\']?([^"\'\s]+)["\']?',
-            'username': r'(?i)(?:username|user|uname)[\s]*[=:]\s*["\']?([^"\'\s]+)["\']?',
-            'api_key': r'(?i)(?:api[_-]?key|token|secret)[\s]*[=:]\s*["\']?([^"\'\s]+)["\']?',
-            'url': r'(?i)(?:url|host|endpoint)[\s]*[=:]\s*["\']?(http[s]?://[^"\'\s]+)["\']?',
-            'email': r'[\w\.-]+@[\w\.-]+\.\w+',
-            'ip_address': r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'
+            'port': rb'(?:^|(?<=[\s=]))(?P<port>\d{2,5})(?=[\s:]|$)',  # Matches potential port numbers
+            'password': rb'(?i:password|passwd|pwd)[^\S\n]*[=:][^\S\n]*["\']?(?P<password>[^"\'\s]+)["\']?',
+            'username': rb'(?i:username|user|uname)[^\S\n]*[=:][^\S\n]*["\']?(?P<username>[^"\'\s]+)["\']?',
+            'api_key': rb'(?i:api[_-]?key|token|secret)[^\S\n]*[=:][^\S\n]*["\']?(?P<api_key>[^"\'\s]+)["\']?',
+            'url': rb'(?i:url|host|endpoint)[^\S\n]*[=:][^\S\n]*["\']?(?P<url>(?i:https?)://[^"\'\s]+)["\']?',
+            'email': rb'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)',
+            'ip_address': rb'(?P<ip_address>(?<!\d)(?:\d{1,3}\.){3}\d{1,3}(?!\d))'
         }
+        self.master = re.compile(b"|".join(self.patterns.values()), re.MULTILINE)
+
+        # Cheap byte-level prescan: a file can only match one of the patterns
+        # above if it contains at least one of these triggers
+        self.trigger = re.compile(
+            rb'passw|pwd|user|uname|api|token|secret|url|host|endpoint|@|\d\d',
+            re.IGNORECASE
+        )
+
+        # Line prefixes that mark a comment
+        self._comment_prefixes = (b'#', b'//', b'/*', b'*', b'--')
 
         # Known safe values that should be ignored
         self.safe_values = {
@@ -28,7 +49,7 @@ class EnvSecretChecker:
         }
 
         # Files and directories to ignore
-        self.ignore_paths = {
+        self.ignore_paths = frozenset({
             '.git',
             'node_modules',
             'venv',
@@ -41,10 +62,10 @@ class EnvSecretChecker:
             '.env.example',
             '.env.template',
             'example.env'
-        }
+        })
 
         # File extensions to check
-        self.check_extensions = {
+        self.check_extensions = (
             '.py',
             '.js',
             '.ts',
@@ -62,23 +83,27 @@ class EnvSecretChecker:
             '.env',
             'Dockerfile',
             'docker-compose.yml'
-        }
+        )
+
+        # Suffixes go in a tuple so str.endswith tests them in one call;
+        # entries without a leading dot are exact file names
+        self._ext_tuple = tuple(e for e in self.check_extensions if e.startswith('.'))
+        self._special_names = frozenset(n for n in self.check_extensions if not n.startswith('.'))
 
     def should_check_file(self, file_path: Path) -> bool:
-        """Determine if a file should be checked."""
-        # Check if any parent directory is in ignore_paths
-        for parent in file_path.parents:
-            if parent.name in self.ignore_paths:
-                return False
+        """Determine if a file should be checked.
+
+        Ignored directories are pruned by check_directory, so only the file
+        itself is inspected here.
+        """
+        name = file_path.name
 
         # Check if file name is in ignore_paths
-        if file_path.name in self.ignore_paths:
+        if name in self.ignore_paths:
             return False
 
-        # Check file extension
-        return any(
-            str(file_path).endswith(ext) for ext in self.check_extensions
-        )
+        # Check file name and extension
+        return name in self._special_names or name.endswith(self._ext_tuple)
 
     def is_safe_value(self, pattern_type: str, value: str) -> bool:
         """Check if a value is in the safe list."""
@@ -89,25 +114,40 @@ class EnvSecretChecker:
         findings = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            for line_num, line in enumerate(lines, 1):
-                # Skip comments
-                if line.strip().startswith(('#', '//', '/*', '*', '--')):
-                    continue
-
-                # Check each pattern
-                for pattern_type, pattern in self.patterns.items():
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        value = match.group(1)
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return findings
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Skip files that cannot contain a match before scanning them
+                    if not self.trigger.search(mm):
+                        return findings
+
+                    # Newline offsets let us map a match offset to its line
+                    nl_offsets = array('Q')
+                    pos = mm.find(b'\n')
+                    while pos != -1:
+                        nl_offsets.append(pos)
+                        pos = mm.find(b'\n', pos + 1)
+
+                    for match in self.master.finditer(mm):
+                        start = match.start()
+                        line_idx = bisect_right(nl_offsets, start)
+                        line_start = nl_offsets[line_idx - 1] + 1 if line_idx else 0
+                        line_end = nl_offsets[line_idx] if line_idx < len(nl_offsets) else len(mm)
+                        line = mm[line_start:line_end].strip()
+
+                        # Skip comments
+                        if line.startswith(self._comment_prefixes):
+                            continue
+
+                        pattern_type = match.lastgroup
+                        value = match.group(pattern_type).decode('utf-8', errors='replace')
                         if not self.is_safe_value(pattern_type, value):
                             findings.append((
                                 str(file_path),
                                 pattern_type,
-                                line_num,
-                                line.strip()
+                                line_idx + 1,
+                                line.decode('utf-8', errors='replace')
                             ))
 
         except Exception as e:
@@ -117,46 +157,55 @@ class EnvSecretChecker:
 
     def check_directory(self, directory: Path) -> List[Tuple[str, str, int, str]]:
         """Recursively check all files in a directory."""
-        findings = []
-        
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and self.should_check_file(file_path):
-                findings.extend(self.check_file(file_path))
-                
-        return findings
+        # Walk the tree with os.scandir so ignored directories are pruned
+        # before we descend into them
+        paths = []
+        stack = [str(directory)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.ignore_paths:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        file_path = Path(entry.path)
+                        if self.should_check_file(file_path):
+                            paths.append(file_path)
+        if not paths:
+            return []
+
+        # Files are independent, so scan them across all cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(self.check_file, paths, chunksize=32)
+            return list(itertools.chain.from_iterable(results))
 
     def format_findings(self, findings: List[Tuple[str, str, int, str]]) -> str:
         """Format findings into a readable report."""
         if not findings:
             return "No potential secrets or configuration values found."
 
-        report = []
-        report.append("\nPotential secrets or configuration values found:")
-        report.append("=" * 80)
-
-        # Group findings by file
-        findings_by_file: Dict[str, List[Tuple[str, int, str]]] = {}
-        for file_path, pattern_type, line_num, line in findings:
-            if file_path not in findings_by_file:
-                findings_by_file[file_path] = []
-            findings_by_file[file_path].append((pattern_type, line_num, line))
-
-        # Generate report
-        for file_path, file_findings in findings_by_file.items():
-            report.append(f"\nFile: {file_path}")
-            report.append("-" * 80)
-            for pattern_type, line_num, line in file_findings:
-                report.append(f"  Line {line_num} ({pattern_type}):")
-                report.append(f"    {line}")
-            report.append("-" * 80)
-
-        report.append("\nRecommendations:")
-        report.append("1. Move these values to environment variables")
-        report.append("2. Use a .env file to store sensitive information")
-        report.append("3. Reference environment variables in your code instead of hardcoded values")
-        report.append("4. Add sensitive files to .gitignore")
+        report = io.StringIO()
+        report.write("\nPotential secrets or configuration values found:\n")
+        report.write("=" * 80 + "\n")
+
+        # Group findings by file; the sort is stable so line order is kept
+        for file_path, file_findings in itertools.groupby(
+            sorted(findings, key=itemgetter(0)), key=itemgetter(0)
+        ):
+            report.write(f"\nFile: {file_path}\n")
+            report.write("-" * 80 + "\n")
+            for _, pattern_type, line_num, line in file_findings:
+                report.write(f"  Line {line_num} ({pattern_type}):\n")
+                report.write(f"    {line}\n")
+            report.write("-" * 80 + "\n")
+
+        report.write("\nRecommendations:\n")
+        report.write("1. Move these values to environment variables\n")
+        report.write("2. Use a .env file to store sensitive information\n")
+        report.write("3. Reference environment variables in your code instead of hardcoded values\n")
+        report.write("4. Add sensitive files to .gitignore")
         
-        return "\n".join(report)
+        return report.getvalue()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -183,7 +232,10 @@ def main():
 
     findings = []
     if path.is_file():
-        if checker.should_check_file(path):
+        # A file passed directly was not reached through check_directory's
+        # pruned walk, so check its ancestors against ignore_paths here
+        ignored = any(part in checker.ignore_paths for part in path.parts)
+        if not ignored and checker.should_check_file(path):
             findings = checker.check_file(path)
     else:
         findings = checker.check_directory(path)
@@ -1,33 +1,79 @@
 #!/usr/bin/env python3
 """Script to check service structure against standardization templates."""
 
+import functools
 import os
 import sys
+import tomllib
 from pathlib import Path
-from typing import Dict, List, Set
-
-import containers.scripts.toml
-import containers.scripts.yaml
-
-
+from typing import Dict, List, Set, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick not available
+    ahocorasick = None
+
+from validators._cache import cached_pickle
+
+REQUIRED_DOCKERFILE_ELEMENTS = [
+    "FROM python:3.11",
+    "POETRY_VERSION",
+    "WORKDIR /app",
+    "COPY",
+    "RUN poetry install",
+    "HEALTHCHECK",
+    "LABEL maintainer"
+]
+
+# Automaton that finds every required element in a single scan. Keys and
+# the Dockerfile text are str, which only the default unicode build of
+# pyahocorasick accepts; a bytes build falls back to one `in` test per element.
+if ahocorasick is not None and ahocorasick.unicode:
+    DOCKERFILE_AUTOMATON = ahocorasick.Automaton()
+    for _element in REQUIRED_DOCKERFILE_ELEMENTS:
+        DOCKERFILE_AUTOMATON.add_word(_element, _element)
+    DOCKERFILE_AUTOMATON.make_automaton()
+else:
+    DOCKERFILE_AUTOMATON = None
+
+
+@functools.lru_cache(maxsize=1)
 def load_standards() -> Dict:
-    """Load standardization templates and requirements."""
+    """Load standardization templates and requirements.
+
+    The parsed templates are pickled to CACHE_DIR and reused while the
+    source files are unchanged. Within a process the result is also
+    memoized; call load_standards.cache_clear() to force a reload.
+    """
     standards_dir = Path(__file__).parent.parent / "docs" / "standards"
+    pyproject_path = standards_dir / "python" / "PYPROJECT_TEMPLATE.toml"
+    dockerfile_path = standards_dir / "docker" / "DOCKERFILE_TEMPLATE"
+    compose_path = standards_dir / "docker" / "DOCKER_COMPOSE_SERVICE_TEMPLATE.yml"
     
-    with open(standards_dir / "python" / "PYPROJECT_TEMPLATE.toml") as f:
-        pyproject_template = toml.load(f)
-    
-    with open(standards_dir / "docker" / "DOCKERFILE_TEMPLATE") as f:
-        dockerfile_template = f.read()
-    
-    with open(standards_dir / "docker" / "DOCKER_COMPOSE_SERVICE_TEMPLATE.yml") as f:
-        docker_compose_template = yaml.safe_load(f)
+    def parse() -> Dict:
+        with open(pyproject_path, "rb") as f:
+            pyproject_template = tomllib.load(f)
+        
+        with open(dockerfile_path) as f:
+            dockerfile_template = f.read()
+        
+        with open(compose_path) as f:
+            docker_compose_template = yaml.load(f.read(), Loader=SafeLoader)
+        
+        return {
+            "pyproject": pyproject_template,
+            "dockerfile": dockerfile_template,
+            "docker_compose": docker_compose_template
+        }
     
-    return {
-        "pyproject": pyproject_template,
-        "dockerfile": dockerfile_template,
-        "docker_compose": docker_compose_template
-    }
+    return cached_pickle("standards", [pyproject_path, dockerfile_path, compose_path], parse)
 
 
 def check_service_structure(service_dir: Path) -> List[str]:
@@ -50,16 +96,17 @@ def check_service_structure(service_dir: Path) -> List[str]:
         "tests/conftest.py"
     }
     
+    # Plain os.path calls avoid building a Path object per check
+    base = str(service_dir)
+    
     # Check directories
     for dir_path in required_dirs:
-        full_path = service_dir / dir_path
-        if not full_path.is_dir():
+        if not os.path.isdir(os.path.join(base, dir_path)):
             errors.append(f"Missing required directory: {dir_path}")
     
     # Check files
     for file_path in required_files:
-        full_path = service_dir / file_path
-        if not full_path.is_file():
+        if not os.path.isfile(os.path.join(base, file_path)):
             errors.append(f"Missing required file: {file_path}")
     
     return errors
@@ -74,8 +121,8 @@ def check_pyproject_toml(service_dir: Path, template: Dict) -> List[str]:
         return ["pyproject.toml not found"]
     
     try:
-        with open(pyproject_path) as f:
-            pyproject = toml.load(f)
+        with open(pyproject_path, "rb") as f:
+            pyproject = tomllib.load(f)
         
         # Check required sections
         required_sections = ["tool.poetry", "tool.poetry.dependencies", "build-system"]
@@ -107,18 +154,13 @@ def check_dockerfile(service_dir: Path, template: str) -> List[str]:
             dockerfile = f.read()
         
         # Check required elements
-        required_elements = [
-            "FROM python:3.11",
-            "POETRY_VERSION",
-            "WORKDIR /app",
-            "COPY",
-            "RUN poetry install",
-            "HEALTHCHECK",
-            "LABEL maintainer"
-        ]
+        if DOCKERFILE_AUTOMATON is not None:
+            found = {element for _, element in DOCKERFILE_AUTOMATON.iter(dockerfile)}
+        else:
+            found = {e for e in REQUIRED_DOCKERFILE_ELEMENTS if e in dockerfile}
         
-        for element in required_elements:
-            if element not in dockerfile:
+        for element in REQUIRED_DOCKERFILE_ELEMENTS:
+            if element not in found:
                 errors.append(f"Missing required Dockerfile element: {element}")
         
     except Exception as e:
@@ -2,13 +2,54 @@
 """Standards checker with modular validator integration"""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import validators
 from containers.scripts.validators.dockerfile_validator import validate_dockerfile
 from containers.scripts.validators.container_validator import validate_container_structure
 from containers.scripts.validators.compose_validator import validate_compose_file
-from containers.scripts.validators.poetry_validator import validate_poetry_config
+from containers.scripts.validators.poetry_validator import check_poetry_config
+
+def _validate_one(container_dir):
+    """Validate a single container, returning (valid, report lines)
+
+    Runs on a worker thread, so nothing here prints; every message goes into
+    the report, which check_containers prints in directory order.
+    """
+    valid = True
+    report = []
+    
+    # Structural validation
+    structure_errors = validate_container_structure(container_dir)
+    if structure_errors:
+        valid = False
+        report.append(f"Container structure validation errors in {container_dir}:")
+        for error in structure_errors:
+            report.append(f"  - {error}")
+    
+    # Poetry validation
+    poetry_valid, poetry_message = check_poetry_config(container_dir)
+    report.append(poetry_message)
+    if not poetry_valid:
+        valid = False
+        report.append(f"Poetry configuration errors in {container_dir}")
+    
+    # Dockerfile validation if file exists
+    dockerfile_path = container_dir / "Dockerfile"
+    if dockerfile_path.exists():
+        dockerfile_errors, dockerfile_warnings = validate_dockerfile(dockerfile_path)
+        if dockerfile_errors:
+            valid = False
+            report.append(f"Dockerfile validation errors in {dockerfile_path}:")
+            for error in dockerfile_errors:
+                report.append(f"  - {error}")
+        if dockerfile_warnings:
+            report.append(f"Dockerfile validation warnings in {dockerfile_path}:")
+            for warning in dockerfile_warnings:
+                report.append(f"  - Warning: {warning}")
+    
+    return valid, report
 
 def check_containers():
     """Validate all containers using the modular validators"""
@@ -16,36 +57,16 @@ def check_containers():
     all_valid = True
     container_dirs = [p for p in Path('./containers').glob('*') if p.is_dir()]
     
-    for container_dir in container_dirs:
-        # Structural validation
-        structure_errors = validate_container_structure(container_dir)
-        if structure_errors:
-            all_valid = False
-            print(f"Container structure validation errors in {container_dir}:")
-            for error in structure_errors:
-                print(f"  - {error}")
-        
-        # Poetry validation
-        poetry_errors = validate_poetry_config(container_dir)
-        if poetry_errors:
-            all_valid = False
-            print(f"Poetry configuration errors in {container_dir}:")
-            for error in poetry_errors:
-                print(f"  - {error}")
-        
-        # Dockerfile validation if file exists
-        dockerfile_path = container_dir / "Dockerfile"
-        if dockerfile_path.exists():
-            dockerfile_errors, dockerfile_warnings = validate_dockerfile(dockerfile_path)
-            if dockerfile_errors:
-                all_valid = False
-                print(f"Dockerfile validation errors in {dockerfile_path}:")
-                for error in dockerfile_errors:
-                    print(f"  - {error}")
-            if dockerfile_warnings:
-                print(f"Dockerfile validation warnings in {dockerfile_path}:")
-                for warning in dockerfile_warnings:
-                    print(f"  - Warning: {warning}")
+    # Containers are independent, so validate them concurrently and print
+    # each report in directory order once it is ready
+    if container_dirs:
+        with ThreadPoolExecutor(max_workers=min(32, len(container_dirs))) as executor:
+            futures = [executor.submit(_validate_one, d) for d in container_dirs]
+            for future in futures:
+                valid, report = future.result()
+                all_valid = all_valid and valid
+                for line in report:
+                    print(line)
     
     # Validate compose file
     compose_path = Path('./containers/dev-environment/docker-compose.dev.yml')
@@ -12,23 +12,62 @@ Usage:
     python container_manager.py version get <container_name>
     python container_manager.py version bump <container_name> [major|minor|patch]
     python container_manager.py version set <container_name> <version>
-    python container_manager.py build <container_name> [--push] [--registry REGISTRY] [--no-latest]
-    python container_manager.py validate <container_name>
+    python container_manager.py build <container_name>... [--push] [--registry REGISTRY] [--no-latest] [--parallel N]
+    python container_manager.py validate <container_name>... [--parallel N]
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import os
 import re
 import subprocess
 import sys
+import tomllib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from validators._cache import CACHE_DIR
 
 # Constants
 PROJECT_ROOT = Path(__file__).parent.parent
 CONTAINERS_DIR = PROJECT_ROOT / "containers"
 
-
+# Default number of containers built/validated at once; capped so small CI
+# runners don't thrash the Docker daemon
+DEFAULT_PARALLELISM = min(os.cpu_count() or 1, 4)
+
+# Containers whose pyproject.toml and Dockerfile passed validation, keyed by
+# a hash of both files and of the validation rules. Kept with the other
+# per-user caches, outside the tracked containers/ tree.
+VALIDATION_CACHE_PATH = CACHE_DIR / "validation_cache.json"
+
+# Precompiled patterns for version handling. They are bytes patterns so
+# files can be rewritten without a text decode/encode round-trip.
+# Version strings may use either TOML quote style; the rewrite keeps it
+_VERSION_SUB_RE = re.compile(rb'(version\s*=\s*)(["\'])[^"\'\n]+\2')
+_VERSION_LINE_RE = re.compile(rb'^([ \t]*version[ \t]*=[ \t]*)(["\'])[^"\'\n]+\2', re.MULTILINE)
+_TABLE_HEADER_RE = re.compile(rb'^[ \t]*\[', re.MULTILINE)
+_OCI_VERSION_RE = re.compile(rb'org\.opencontainers\.image\.version="[^"]+"')
+_ENV_RE = re.compile(rb'(ENV\s+[^\n]+\n\s*(?:ENV\s+[^\n]+\n\s*)*)')
+_FROM_RE = re.compile(rb'(FROM\s+[^\n]+\n)')
+
+# Elements every Dockerfile must contain, matched in a single pass. Each
+# alternative is a named group so the matching element is m.lastgroup.
+_DOCKERFILE_REQUIRED = ("FROM", "WORKDIR", "COPY", "RUN", "EXPOSE", "CMD")
+_DOCKERFILE_REQUIRED_RE = re.compile(
+    rb'(?P<FROM>FROM\s+python)'
+    rb'|(?P<WORKDIR>WORKDIR\s+/app)'
+    rb'|(?P<COPY>COPY\s+.*pyproject\.toml)'
+    rb'|(?P<RUN>RUN\s+.*poetry\s+install)'
+    rb'|(?P<EXPOSE>EXPOSE\s+\d+)'
+    rb'|(?P<CMD>CMD\s+\[)'
+)
+
+
+@functools.lru_cache(maxsize=None)
 def get_container_dir(container_name: str) -> Path:
     """Get the directory for a specific container."""
     container_dir = CONTAINERS_DIR / container_name
@@ -37,36 +76,71 @@ def get_container_dir(container_name: str) -> Path:
     return container_dir
 
 
+@functools.lru_cache(maxsize=None)
 def get_pyproject_path(container_name: str) -> Path:
-    """Get the path to the pyproject.toml file for a container."""
-    container_dir = get_container_dir(container_name)
-    pyproject_path = container_dir / "pyproject.toml"
-    if not pyproject_path.exists():
-        raise ValueError(f"pyproject.toml not found for container '{container_name}'")
-    return pyproject_path
+    """Get the path to the pyproject.toml file for a container.
 
+    The file isn't stat'ed here; readers raise ValueError if it's missing.
+    """
+    return get_container_dir(container_name) / "pyproject.toml"
 
+
+@functools.lru_cache(maxsize=None)
 def get_dockerfile_path(container_name: str) -> Path:
-    """Get the path to the Dockerfile for a container."""
-    container_dir = get_container_dir(container_name)
-    dockerfile_path = container_dir / "Dockerfile"
-    if not dockerfile_path.exists():
-        raise ValueError(f"Dockerfile not found for container '{container_name}'")
-    return dockerfile_path
+    """Get the path to the Dockerfile for a container.
+
+    The file isn't stat'ed here; readers raise ValueError if it's missing.
+    """
+    return get_container_dir(container_name) / "Dockerfile"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pyproject(pyproject_path: Path) -> Dict[str, Any]:
+    """Parse a pyproject.toml once; cleared whenever the file is rewritten."""
+    return tomllib.loads(pyproject_path.read_bytes().decode("utf-8"))
+
+
+def _version_table(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the table holding the package version ([project] or [tool.poetry])."""
+    project = data.get("project", {})
+    if "version" in project:
+        return project
+    poetry = data.get("tool", {}).get("poetry", {})
+    if "version" in poetry:
+        return poetry
+    return None
+
+
+def _version_table_span(content: bytes, data: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """Locate the byte range of the table _version_table resolves to in content."""
+    if "version" in data.get("project", {}):
+        header = rb"project"
+    elif "version" in data.get("tool", {}).get("poetry", {}):
+        header = rb"tool\.poetry"
+    else:
+        return None
+    match = re.search(rb'^[ \t]*\[[ \t]*' + header + rb'[ \t]*\][^\n]*(?:\n|$)', content, re.MULTILINE)
+    if not match:
+        return None
+    next_header = _TABLE_HEADER_RE.search(content, match.end())
+    return match.end(), next_header.start() if next_header else len(content)
 
 
+@functools.lru_cache(maxsize=None)
 def get_current_version(container_name: str) -> str:
     """Get the current version from a container's pyproject.toml."""
     pyproject_path = get_pyproject_path(container_name)
     
-    with open(pyproject_path, "r") as f:
-        content = f.read()
+    try:
+        table = _version_table(_load_pyproject(pyproject_path))
+    except FileNotFoundError:
+        raise ValueError(f"pyproject.toml not found for container '{container_name}'") from None
+    version = table["version"] if table else None
     
-    match = re.search(r'version\s*=\s*"([^"]+)"', content)
-    if not match:
+    if not version:
         raise ValueError(f"Could not find version in {pyproject_path}")
     
-    return match.group(1)
+    return version
 
 
 def parse_version(version: str) -> Tuple[int, int, int]:
@@ -92,42 +166,76 @@ def bump_version(current_version: str, bump_type: str) -> str:
         raise ValueError(f"Invalid bump type: {bump_type}. Expected: major, minor, or patch")
 
 
-def update_pyproject(container_name: str, new_version: str) -> None:
-    """Update the version in a container's pyproject.toml."""
+def _render_pyproject_version(container_name: str, new_version: str) -> Tuple[Path, bytes]:
+    """Return pyproject.toml's path and its content with the version replaced.
+
+    Raises ValueError if the file is missing or no version line could be
+    rewritten, before anything has been written.
+    """
     pyproject_path = get_pyproject_path(container_name)
     
-    with open(pyproject_path, "r") as f:
-        content = f.read()
+    try:
+        data = _load_pyproject(pyproject_path)
+        content = pyproject_path.read_bytes()
+    except FileNotFoundError:
+        raise ValueError(f"pyproject.toml not found for container '{container_name}'") from None
+    
+    version = new_version.encode()
+    
+    def replace(match: "re.Match[bytes]") -> bytes:
+        quote = match.group(2)
+        return match.group(1) + quote + version + quote
+    
+    span = _version_table_span(content, data)
+    if span is not None:
+        # Rewrite only the version line of the package's table, leaving
+        # comments, quoting and every other 'version = ' key untouched
+        start, end = span
+        section, count = _VERSION_LINE_RE.subn(replace, content[start:end], count=1)
+        updated_content = content[:start] + section + content[end:]
+    else:
+        updated_content, count = _VERSION_SUB_RE.subn(replace, content)
     
-    updated_content = re.sub(
-        r'version\s*=\s*"[^"]+"',
-        f'version = "{new_version}"',
-        content
-    )
+    if count == 0:
+        raise ValueError(f"Could not find a version line to update in {pyproject_path}")
     
-    with open(pyproject_path, "w") as f:
+    return pyproject_path, updated_content
+
+
+def _write_pyproject_version(pyproject_path: Path, updated_content: bytes) -> Path:
+    """Write rendered pyproject.toml content in place and return its path."""
+    with open(pyproject_path, "rb+") as f:
         f.write(updated_content)
+        f.truncate()
     
-    print(f"Updated {pyproject_path} with version {new_version}")
+    # The cached data is stale now that the file has changed
+    _load_pyproject.cache_clear()
+    get_current_version.cache_clear()
+    
+    return pyproject_path
 
 
-def update_dockerfile(container_name: str, new_version: str) -> None:
-    """Update the version in a container's Dockerfile."""
+def _write_dockerfile_version(container_name: str, new_version: str) -> Path:
+    """Rewrite the version label in the Dockerfile in place and return its path."""
     dockerfile_path = get_dockerfile_path(container_name)
     
-    with open(dockerfile_path, "r") as f:
-        content = f.read()
+    try:
+        f = open(dockerfile_path, "rb+")
+    except FileNotFoundError:
+        raise ValueError(f"Dockerfile not found for container '{container_name}'") from None
     
-    # Check if version label exists
-    if "org.opencontainers.image.version" in content:
-        updated_content = re.sub(
-            r'org\.opencontainers\.image\.version="[^"]+"',
-            f'org.opencontainers.image.version="{new_version}"',
-            content
-        )
-    else:
-        # Add version labels if they don't exist
-        label_section = f"""
+    with f:
+        content = f.read()
+        
+        # Check if version label exists
+        if b"org.opencontainers.image.version" in content:
+            updated_content = _OCI_VERSION_RE.sub(
+                f'org.opencontainers.image.version="{new_version}"'.encode(),
+                content
+            )
+        else:
+            # Add version labels if they don't exist
+            label_section = f"""
 # Add version labels
 LABEL org.opencontainers.image.title="{container_name.capitalize()} Service" \
       org.opencontainers.image.description="{container_name.capitalize()} service" \
@@ -135,35 +243,62 @@ LABEL org.opencontainers.image.title="{container_name.capitalize()} Service" \
       org.opencontainers.image.vendor="AI Development Team" \
       org.opencontainers.image.created="$(date -u +'%Y-%m-%dT%H:%M:%SZ')" \
       org.opencontainers.image.source="https://github.com/organization/project"
-"""
-        # Insert after the ENV sections
-        env_pattern = r'(ENV\s+[^\n]+\n\s*(?:ENV\s+[^\n]+\n\s*)*)'
-        if re.search(env_pattern, content):
-            updated_content = re.sub(
-                env_pattern,
-                r'\1' + label_section,
-                content,
-                count=1
-            )
-        else:
-            # If no ENV section, insert after FROM
-            updated_content = re.sub(
-                r'(FROM\s+[^\n]+\n)',
-                r'\1' + label_section,
-                content,
-                count=1
-            )
-    
-    with open(dockerfile_path, "w") as f:
+""".encode()
+            # Insert after the ENV sections, or after FROM if there are none.
+            # Splice at the match end instead of re-scanning with sub().
+            anchor = _ENV_RE.search(content) or _FROM_RE.search(content)
+            if anchor:
+                end = anchor.end()
+                updated_content = content[:end] + label_section + content[end:]
+            else:
+                updated_content = content
+        
+        f.seek(0)
+        f.truncate()
         f.write(updated_content)
     
+    return dockerfile_path
+
+
+def update_pyproject(container_name: str, new_version: str) -> None:
+    """Update the version in a container's pyproject.toml."""
+    pyproject_path = _write_pyproject_version(container_name, new_version)
+    print(f"Updated {pyproject_path} with version {new_version}")
+
+
+def update_dockerfile(container_name: str, new_version: str) -> None:
+    """Update the version in a container's Dockerfile."""
+    dockerfile_path = _write_dockerfile_version(container_name, new_version)
+    print(f"Updated {dockerfile_path} with version {new_version}")
+
+
+def update_version(container_name: str, new_version: str) -> None:
+    """Update the version in both pyproject.toml and the Dockerfile.
+
+    The two files are independent, so they are rewritten concurrently. The
+    pyproject.toml edit is prepared first, so a file without a usable
+    version line fails before either file is touched.
+    """
+    pyproject_path, pyproject_content = _render_pyproject_version(container_name, new_version)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pyproject_future = executor.submit(_write_pyproject_version, pyproject_path, pyproject_content)
+        dockerfile_future = executor.submit(_write_dockerfile_version, container_name, new_version)
+        pyproject_path = pyproject_future.result()
+        dockerfile_path = dockerfile_future.result()
+    
+    print(f"Updated {pyproject_path} with version {new_version}")
     print(f"Updated {dockerfile_path} with version {new_version}")
 
 
 def build_container(container_name: str, version: Optional[str] = None, 
                    push: bool = False, registry: Optional[str] = None,
-                   tag_latest: bool = True) -> None:
-    """Build a container with the specified version."""
+                   tag_latest: bool = True, registry_cache: bool = False) -> None:
+    """Build a container with the specified version.
+
+    With ``registry_cache`` the build imports and exports BuildKit layer
+    cache from ``<image>:buildcache`` and also reuses layers from
+    ``<image>:latest`` so unchanged layers are not rebuilt on fresh runners.
+    """
     if not version:
         version = get_current_version(container_name)
     
@@ -174,12 +309,27 @@ def build_container(container_name: str, version: Optional[str] = None,
     if registry:
         image_name = f"{registry}/{image_name}"
     
-    # Build the image
+    # Build, tag and optionally push in a single buildx invocation so each
+    # layer is uploaded once for all tags
     print(f"Building {container_name} container version {version}...")
     
     build_cmd = [
-        "docker", "build",
+        "docker", "buildx", "build",
         "-t", f"{image_name}:{version}",
+    ]
+    if tag_latest:
+        build_cmd += ["-t", f"{image_name}:latest"]
+    build_cmd.append("--push" if push else "--load")
+    if registry_cache:
+        # Pull the previous image so its layers are available even when the
+        # registry cache is missing; a failed pull is not fatal
+        subprocess.run(["docker", "pull", f"{image_name}:latest"], check=False)
+        build_cmd += [
+            "--cache-from", f"{image_name}:latest",
+            "--cache-from", f"type=registry,ref={image_name}:buildcache",
+            "--cache-to", f"type=registry,ref={image_name}:buildcache,mode=max",
+        ]
+    build_cmd += [
         "-f", str(container_dir / "Dockerfile"),
         "--build-arg", f"VERSION={version}",
         "."
@@ -192,41 +342,74 @@ def build_container(container_name: str, version: Optional[str] = None,
         print(f"Error building container: {e}")
         sys.exit(1)
     
-    # Tag as latest if requested
-    if tag_latest:
-        print(f"Tagging {image_name}:{version} as latest...")
-        tag_cmd = ["docker", "tag", f"{image_name}:{version}", f"{image_name}:latest"]
-        try:
-            subprocess.run(tag_cmd, check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error tagging container: {e}")
-            sys.exit(1)
-    
-    # Push if requested
-    if push:
-        print(f"Pushing {image_name}:{version}...")
-        push_cmd = ["docker", "push", f"{image_name}:{version}"]
-        try:
-            subprocess.run(push_cmd, check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error pushing container: {e}")
-            sys.exit(1)
-        
-        if tag_latest:
-            print(f"Pushing {image_name}:latest...")
-            push_latest_cmd = ["docker", "push", f"{image_name}:latest"]
-            try:
-                subprocess.run(push_latest_cmd, check=True)
-            except subprocess.CalledProcessError as e:
-                print(f"Error pushing latest tag: {e}")
-                sys.exit(1)
-    
     print(f"Build completed successfully!")
     print(f"Image: {image_name}:{version}")
 
 
+@functools.lru_cache(maxsize=1)
+def _validator_digest() -> bytes:
+    """Hash this module, which holds every validation rule, so edits to the
+    rules invalidate earlier results."""
+    with open(__file__, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def _validation_key(container_name: str) -> str:
+    """Hash the validator and every file the content checks read into a cache key.
+
+    The required files and directories are checked on every run, so only the
+    files whose contents are validated need to be part of the key.
+    """
+    digest = hashlib.sha256(_validator_digest())
+    for path in (get_pyproject_path(container_name), get_dockerfile_path(container_name)):
+        digest.update(path.name.encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
+
+def _load_validation_cache() -> Dict[str, str]:
+    """Load the validation cache, treating a missing or corrupt file as empty."""
+    try:
+        return json.loads(VALIDATION_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_validation_results(results: Dict[str, str]) -> None:
+    """Record the containers that validated successfully, keyed by directory.
+
+    Called once per run from the parent process, after any worker pool has
+    finished, so results from concurrent containers are never lost.
+    """
+    cache = _load_validation_cache()
+    cache.update(results)
+    # Write to a temporary file and rename so concurrent runs never see a
+    # partially written cache
+    tmp_path = VALIDATION_CACHE_PATH.with_name(f"{VALIDATION_CACHE_PATH.name}.{os.getpid()}")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        os.replace(tmp_path, VALIDATION_CACHE_PATH)
+    except OSError:
+        pass
+
+
 def validate_container(container_name: str) -> bool:
     """Validate a container's structure and configuration."""
+    cache_entry = _validate_container(container_name, _load_validation_cache())
+    if cache_entry is None:
+        return False
+    _store_validation_results(dict([cache_entry]))
+    return True
+
+
+def _validate_container(container_name: str, cache: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    """Validate a container against the given cache snapshot.
+
+    Returns the (container directory, key) cache entry on success and None on
+    failure; the caller decides when to write it back.
+    """
     container_dir = get_container_dir(container_name)
     
     # Check for required files
@@ -235,7 +418,7 @@ def validate_container(container_name: str) -> bool:
     
     if missing_files:
         print(f"Container '{container_name}' is missing required files: {', '.join(missing_files)}")
-        return False
+        return None
     
     # Check for required directories
     required_dirs = ["src", "tests"]
@@ -243,7 +426,13 @@ def validate_container(container_name: str) -> bool:
     
     if missing_dirs:
         print(f"Container '{container_name}' is missing required directories: {', '.join(missing_dirs)}")
-        return False
+        return None
+    
+    # Skip the content checks if neither file changed since the last pass
+    cache_entry = (str(container_dir.resolve()), _validation_key(container_name))
+    if cache.get(cache_entry[0]) == cache_entry[1]:
+        print(f"Container '{container_name}' validation successful!")
+        return cache_entry
     
     # Validate pyproject.toml
     try:
@@ -251,36 +440,52 @@ def validate_container(container_name: str) -> bool:
         parse_version(version)
     except ValueError as e:
         print(f"Invalid version in pyproject.toml: {e}")
-        return False
+        return None
     
     # Validate Dockerfile
     dockerfile_path = get_dockerfile_path(container_name)
-    with open(dockerfile_path, "r") as f:
-        dockerfile_content = f.read()
+    dockerfile_content = dockerfile_path.read_bytes()
     
     # Check for required Dockerfile elements
-    required_elements = [
-        ("FROM", r'FROM\s+python'),
-        ("WORKDIR", r'WORKDIR\s+/app'),
-        ("COPY", r'COPY\s+.*pyproject\.toml'),
-        ("RUN", r'RUN\s+.*poetry\s+install'),
-        ("EXPOSE", r'EXPOSE\s+\d+'),
-        ("CMD", r'CMD\s+\[')
-    ]
+    found = {m.lastgroup for m in _DOCKERFILE_REQUIRED_RE.finditer(dockerfile_content)}
     
-    for name, pattern in required_elements:
-        if not re.search(pattern, dockerfile_content):
+    for name in _DOCKERFILE_REQUIRED:
+        if name not in found:
             print(f"Dockerfile missing required element: {name}")
-            return False
+            return None
     
     print(f"Container '{container_name}' validation successful!")
-    return True
-
-
-def list_containers() -> List[str]:
-    """List all available containers."""
-    return [d.name for d in CONTAINERS_DIR.iterdir() 
-            if d.is_dir() and (d / "Dockerfile").exists()]
+    return cache_entry
+
+
+def list_containers() -> List[Tuple[str, bool, Optional[Path]]]:
+    """List all container directories in a single scan.
+
+    Returns (name, dockerfile_exists, pyproject_path) tuples, where
+    pyproject_path is None if the container has no pyproject.toml.
+    """
+    containers = []
+    with os.scandir(CONTAINERS_DIR) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as files:
+                names = {f.name for f in files}
+            pyproject_path = Path(entry.path) / "pyproject.toml" if "pyproject.toml" in names else None
+            containers.append((entry.name, "Dockerfile" in names, pyproject_path))
+    return containers
+
+
+def read_version(pyproject_path: Optional[Path]) -> Optional[str]:
+    """Read the version from a pyproject.toml, or None if it can't be found."""
+    if pyproject_path is None:
+        return None
+    try:
+        table = _version_table(_load_pyproject(pyproject_path))
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+        return None
+    version = table["version"] if table else None
+    return version if isinstance(version, str) else None
 
 
 def handle_version_command(args: argparse.Namespace) -> None:
@@ -299,8 +504,7 @@ def handle_version_command(args: argparse.Namespace) -> None:
         try:
             current_version = get_current_version(container_name)
             new_version = bump_version(current_version, args.bump_type)
-            update_pyproject(container_name, new_version)
-            update_dockerfile(container_name, new_version)
+            update_version(container_name, new_version)
             print(f"Bumped {container_name} version from {current_version} to {new_version}")
         except ValueError as e:
             print(f"Error: {e}")
@@ -311,32 +515,74 @@ def handle_version_command(args: argparse.Namespace) -> None:
             current_version = get_current_version(container_name)
             # Validate the version format
             parse_version(args.version)
-            update_pyproject(container_name, args.version)
-            update_dockerfile(container_name, args.version)
+            update_version(container_name, args.version)
             print(f"Set {container_name} version from {current_version} to {args.version}")
         except ValueError as e:
             print(f"Error: {e}")
             sys.exit(1)
 
 
-def handle_build_command(args: argparse.Namespace) -> None:
-    """Handle the 'build' subcommand."""
+def _build_one(container_name: str, **options) -> bool:
+    """Build a single container, returning False instead of exiting on failure."""
     try:
-        build_container(
-            args.container_name,
-            version=args.version,
-            push=args.push,
-            registry=args.registry,
-            tag_latest=not args.no_latest
-        )
+        build_container(container_name, **options)
     except ValueError as e:
         print(f"Error: {e}")
+        return False
+    except SystemExit:
+        return False
+    return True
+
+
+def _validate_one(container_name: str, cache: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    """Validate a single container, returning its cache entry or None on any failure."""
+    try:
+        return _validate_container(container_name, cache)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+
+
+def map_containers(func, container_names: List[str], parallel: int) -> List[Any]:
+    """Run func for each container on a bounded process pool, returning the results in order."""
+    if len(container_names) == 1:
+        return [func(container_names[0])]
+    
+    max_workers = max(1, min(parallel, len(container_names)))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, container_names))
+
+
+def run_for_containers(func, container_names: List[str], parallel: int) -> bool:
+    """Run func for each container on a bounded process pool; True if all succeed."""
+    return all(map_containers(func, container_names, parallel))
+
+
+def handle_build_command(args: argparse.Namespace) -> None:
+    """Handle the 'build' subcommand."""
+    build = functools.partial(
+        _build_one,
+        version=args.version,
+        push=args.push,
+        registry=args.registry,
+        tag_latest=not args.no_latest,
+        registry_cache=args.registry_cache
+    )
+    if not run_for_containers(build, args.container_names, args.parallel):
         sys.exit(1)
 
 
 def handle_validate_command(args: argparse.Namespace) -> None:
     """Handle the 'validate' subcommand."""
-    if not validate_container(args.container_name):
+    # Workers only read the cache snapshot; the parent merges and writes the
+    # new entries once the pool has finished
+    cache = _load_validation_cache()
+    validate = functools.partial(_validate_one, cache=cache)
+    results = map_containers(validate, args.container_names, args.parallel)
+    passed = [entry for entry in results if entry is not None]
+    if passed:
+        _store_validation_results(dict(passed))
+    if len(passed) != len(results):
         sys.exit(1)
 
 
@@ -368,15 +614,23 @@ def main() -> None:
     
     # Build command
     build_parser = subparsers.add_parser("build", help="Build container image")
-    build_parser.add_argument("container_name", help="Name of the container to build")
+    build_parser.add_argument("container_names", nargs="+", metavar="container_name",
+                              help="Name of the container(s) to build")
     build_parser.add_argument("--version", "-v", help="Specify the version to build")
     build_parser.add_argument("--push", action="store_true", help="Push the image after building")
     build_parser.add_argument("--registry", help="Specify the registry to push to")
     build_parser.add_argument("--no-latest", action="store_true", help="Don't tag as latest")
+    build_parser.add_argument("--registry-cache", action="store_true",
+                              help="Import/export the layer cache from <image>:buildcache in the registry")
+    build_parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLELISM, metavar="N",
+                              help=f"Number of containers to build at once (default: {DEFAULT_PARALLELISM})")
     
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate container structure")
-    validate_parser.add_argument("container_name", help="Name of the container to validate")
+    validate_parser.add_argument("container_names", nargs="+", metavar="container_name",
+                                 help="Name of the container(s) to validate")
+    validate_parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLELISM, metavar="N",
+                                 help=f"Number of containers to validate at once (default: {DEFAULT_PARALLELISM})")
     
     # List command
     list_parser = subparsers.add_parser("list", help="List available containers")
@@ -396,14 +650,16 @@ def main() -> None:
         handle_validate_command(args)
     
     elif args.command == "list":
-        containers = list_containers()
+        containers = [c for c in list_containers() if c[1]]
         if containers:
             print("Available containers:")
-            for container in containers:
-                try:
-                    version = get_current_version(container)
+            # Overlap the pyproject.toml reads, then print in listing order
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                versions = list(executor.map(read_version, [c[2] for c in containers]))
+            for (container, _, _), version in zip(containers, versions):
+                if version:
                     print(f"  - {container} (v{version})")
-                except ValueError:
+                else:
                     print(f"  - {container} (version unknown)")
         else:
             print("No containers found")
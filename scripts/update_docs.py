@@ -6,15 +6,17 @@ Automatically generates and updates documentation for services based on standard
 Extracts API documentation, configuration details, and maintains consistent structure.
 """
 
+import ast
+import functools
+import io
 import os
 import sys
-import containers.scripts.yaml
+import yaml
 import logging
-import containers.scripts.inspect
-import containers.scripts.importlib
-import containers.scripts.importlib.util
+import inspect
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 import re
 from datetime import datetime
 
@@ -25,96 +27,151 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# FastAPI decorator attributes that declare a route
+ROUTE_METHODS = {"get", "post", "put", "delete", "patch"}
+
+# Service name (first heading) and overview paragraph of a README, in one scan
+_README_HEADER_RE = re.compile(
+    rb'# (?P<name>.*?)\n(?:.*?## Overview\n\n(?P<overview>.*?)\n\n)?',
+    re.DOTALL
+)
+
+def _replace_file(path: Path, text: str) -> None:
+    """Write text to path in one step, so a failure never leaves it truncated."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
 class DocGenerator:
     """Generates and updates documentation following project standards."""
     
+    # Parsed rules files, shared by every generator in the process
+    _rules_cache: Dict[Path, Dict[str, Any]] = {}
+    
     def __init__(self, rules_file: str = ".cursor/standardization.cursorrules"):
         """Initialize the generator with rules from the specified file."""
         self.rules_file = Path(rules_file)
         self.rules = self._load_rules()
 
     def _load_rules(self) -> Dict[str, Any]:
-        """Load rules from the YAML file."""
+        """Load rules from the YAML file, parsing each file only once."""
+        key = self.rules_file.resolve()
+        if key in self._rules_cache:
+            return self._rules_cache[key]
         try:
-            with open(self.rules_file, 'r') as f:
-                return yaml.safe_load(f)
+            rules = yaml.safe_load(self.rules_file.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load rules file: {e}")
             sys.exit(1)
+        self._rules_cache[key] = rules
+        return rules
+
+    def _parse_module(self, module_path: str) -> Optional[ast.Module]:
+        """Parse a module's source without executing it."""
+        return self._parse_module_cached(os.path.realpath(module_path))
 
-    def _import_module(self, module_path: str) -> Optional[Any]:
-        """Dynamically import a module from file path."""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _parse_module_cached(module_path: str) -> Optional[ast.Module]:
+        """Parse a module by real path, at most once per process."""
         try:
-            spec = importlib.util.spec_from_file_location(
-                module_path.replace('/', '.').replace('.py', ''),
-                module_path
-            )
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                return module
-        except Exception as e:
-            logger.warning(f"Failed to import module {module_path}: {e}")
+            return ast.parse(Path(module_path).read_bytes(), filename=module_path)
+        except (OSError, SyntaxError, ValueError) as e:
+            logger.warning(f"Failed to parse module {module_path}: {e}")
         return None
 
+    def _extract_routes(self, tree: ast.Module, owner: str) -> List[tuple]:
+        """Find (path, method, docstring) for functions decorated with @owner.<method>(path)."""
+        routes = []
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for decorator in node.decorator_list:
+                if not (isinstance(decorator, ast.Call)
+                        and isinstance(decorator.func, ast.Attribute)
+                        and decorator.func.attr in ROUTE_METHODS
+                        and isinstance(decorator.func.value, ast.Name)
+                        and decorator.func.value.id == owner
+                        and decorator.args
+                        and isinstance(decorator.args[0], ast.Constant)
+                        and isinstance(decorator.args[0].value, str)):
+                    continue
+                routes.append((
+                    decorator.args[0].value,
+                    decorator.func.attr.upper(),
+                    ast.get_docstring(node)
+                ))
+        return routes
+
     def _extract_docstring(self, obj: Any) -> str:
         """Extract and format docstring from an object."""
         doc = inspect.getdoc(obj) or ""
         return doc.strip()
 
-    def _generate_api_docs(self, service_dir: Path) -> str:
-        """Generate API documentation from FastAPI endpoints."""
-        api_docs = ["## API Reference\n"]
+    def _generate_api_docs(self, service_dir: Path, write: Callable[[str], Any]) -> None:
+        """Write API documentation from FastAPI endpoints, one line per call."""
+        write("## API Reference\n\n")
         main_path = service_dir / "api" / "main.py"
         routes_path = service_dir / "api" / "routes.py"
         
         # Document main endpoints
         if main_path.exists():
-            main_module = self._import_module(str(main_path))
-            if main_module and hasattr(main_module, 'app'):
-                for route in main_module.app.routes:
-                    if route.path in ["/health", "/version"]:
-                        api_docs.append(f"### {route.path}")
-                        api_docs.append(f"**Method:** {route.methods}")
-                        if route.endpoint.__doc__:
-                            api_docs.append(f"\n{route.endpoint.__doc__.strip()}\n")
-                        api_docs.append("")
+            tree = self._parse_module(str(main_path))
+            if tree:
+                for path, method, doc in self._extract_routes(tree, 'app'):
+                    if path in ["/health", "/version"]:
+                        write(f"### {path}\n")
+                        write(f"**Method:** {{'{method}'}}\n")
+                        if doc:
+                            write(f"\n{doc.strip()}\n\n")
+                        write("\n")
 
         # Document custom routes
         if routes_path.exists():
-            routes_module = self._import_module(str(routes_path))
-            if routes_module and hasattr(routes_module, 'router'):
-                for route in routes_module.router.routes:
-                    api_docs.append(f"### {route.path}")
-                    api_docs.append(f"**Method:** {route.methods}")
-                    if route.endpoint.__doc__:
-                        api_docs.append(f"\n{route.endpoint.__doc__.strip()}\n")
-                    api_docs.append("")
-
-        return "\n".join(api_docs)
-
-    def _generate_config_docs(self, service_dir: Path) -> str:
-        """Generate configuration documentation."""
-        config_docs = ["## Configuration\n"]
+            tree = self._parse_module(str(routes_path))
+            if tree:
+                for path, method, doc in self._extract_routes(tree, 'router'):
+                    write(f"### {path}\n")
+                    write(f"**Method:** {{'{method}'}}\n")
+                    if doc:
+                        write(f"\n{doc.strip()}\n\n")
+                    write("\n")
+
+    def _generate_config_docs(self, service_dir: Path, write: Callable[[str], Any]) -> None:
+        """Write configuration documentation, one line per call."""
+        write("## Configuration\n\n")
         settings_path = service_dir / "config" / "settings.py"
         
         if settings_path.exists():
-            settings_module = self._import_module(str(settings_path))
-            if settings_module and hasattr(settings_module, 'Settings'):
-                settings_class = settings_module.Settings
-                config_docs.append("### Environment Variables\n")
+            tree = self._parse_module(str(settings_path))
+            settings_class = None
+            if tree:
+                settings_class = next(
+                    (node for node in tree.body
+                     if isinstance(node, ast.ClassDef) and node.name == 'Settings'),
+                    None
+                )
+            if settings_class:
+                write("### Environment Variables\n\n")
                 
-                # Get annotations (type hints) for settings
-                annotations = settings_class.__annotations__
-                
-                for var_name, var_type in annotations.items():
-                    default_value = getattr(settings_class, var_name, None)
-                    config_docs.append(f"- `{var_name}` ({var_type.__name__})")
-                    if default_value is not None:
-                        config_docs.append(f"  - Default: `{default_value}`")
-                config_docs.append("")
-
-        return "\n".join(config_docs)
+                # Read annotated class attributes (type hints) for settings
+                for node in settings_class.body:
+                    if not (isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name)):
+                        continue
+                    var_name = node.target.id
+                    var_type = ast.unparse(node.annotation)
+                    write(f"- `{var_name}` ({var_type})\n")
+                    if node.value is not None:
+                        try:
+                            default_value = ast.literal_eval(node.value)
+                        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                            default_value = ast.unparse(node.value)
+                        if default_value is not None:
+                            write(f"  - Default: `{default_value}`\n")
+                write("\n")
 
     def _generate_development_docs(self, service_dir: Path) -> str:
         """Generate development documentation."""
@@ -197,52 +254,46 @@ The service exposes the following metrics:
     def _update_readme(self, service_dir: Path):
         """Update the main README.md with generated documentation."""
         readme_path = service_dir / "README.md"
-        if not readme_path.exists():
-            logger.warning(f"README.md not found in {service_dir}")
-            return
 
         # Read existing content
-        with open(readme_path, 'r') as f:
-            content = f.read()
+        try:
+            content = readme_path.read_bytes()
+        except FileNotFoundError:
+            logger.warning(f"README.md not found in {service_dir}")
+            return
 
         # Extract service name and overview
         service_name = ""
         overview = ""
-        name_match = re.search(r'# (.*?)\n', content)
-        if name_match:
-            service_name = name_match.group(1)
-        overview_match = re.search(r'## Overview\n\n(.*?)\n\n', content, re.DOTALL)
-        if overview_match:
-            overview = overview_match.group(1)
-
-        # Generate new documentation
-        new_content = [
-            f"# {service_name}\n",
-            "## Overview\n",
-            f"{overview}\n",
-            self._generate_config_docs(service_dir),
-            self._generate_api_docs(service_dir),
-            self._generate_development_docs(service_dir),
-            self._generate_deployment_docs(service_dir)
-        ]
-
-        # Write updated content
-        with open(readme_path, 'w') as f:
-            f.write("\n".join(new_content))
+        header_match = _README_HEADER_RE.search(content)
+        if header_match:
+            service_name = header_match.group('name').decode('utf-8')
+            overview = (header_match.group('overview') or b"").decode('utf-8')
+
+        # Build the new documentation in memory, then swap it in whole
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# {service_name}\n\n")
+        write("## Overview\n\n")
+        write(f"{overview}\n\n")
+        self._generate_config_docs(service_dir, write)
+        self._generate_api_docs(service_dir, write)
+        write(self._generate_development_docs(service_dir))
+        write("\n")
+        write(self._generate_deployment_docs(service_dir))
+        _replace_file(readme_path, buf.getvalue())
 
     def _generate_api_reference(self, service_dir: Path):
         """Generate detailed API reference documentation."""
         api_doc_path = service_dir / "docs" / "API.md"
-        api_content = [
-            "# API Reference\n",
-            "## Overview\n",
-            "This document provides detailed information about the service's API endpoints.\n",
-            self._generate_api_docs(service_dir)
-        ]
-        
-        os.makedirs(api_doc_path.parent, exist_ok=True)
-        with open(api_doc_path, 'w') as f:
-            f.write("\n".join(api_content))
+        api_doc_path.parent.mkdir(parents=True, exist_ok=True)
+        buf = io.StringIO()
+        write = buf.write
+        write("# API Reference\n\n")
+        write("## Overview\n\n")
+        write("This document provides detailed information about the service's API endpoints.\n\n")
+        self._generate_api_docs(service_dir, write)
+        _replace_file(api_doc_path, buf.getvalue())
 
     def update_docs(self, service_dir: str = "."):
         """Update all documentation for the service."""
@@ -269,10 +320,18 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description="Update service documentation.")
     parser.add_argument("--service-dir", default=".", help="Service directory to update docs for")
+    parser.add_argument("--services", nargs="+", metavar="DIR",
+                        help="Update docs for several service directories in parallel")
     args = parser.parse_args()
     
     generator = DocGenerator()
-    generator.update_docs(args.service_dir)
+    if args.services and len(args.services) > 1:
+        # Each service is independent; parse and render them on separate cores
+        max_workers = min(len(args.services), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(generator.update_docs, args.services))
+    else:
+        generator.update_docs(args.services[0] if args.services else args.service_dir)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -5,28 +5,82 @@ Validation Runner
 Runs all validators for a specified container.
 """
 
+import os
 import sys
+import selectors
 import subprocess
 import argparse
 from pathlib import Path
 
+def run_validators(validators):
+    """Run all validators at once, streaming their output in list order.
+
+    Every validator is started immediately and its stdout and stderr are
+    read through a selector as they arrive, each kept on its own stream.
+    Output from the validator currently at the head of the list is written
+    straight through; output from the others is buffered until every
+    validator before them finishes. Returns the validators' return codes
+    in order.
+    """
+    procs = [
+        subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
+        for _, command in validators
+    ]
+    outputs = (sys.stdout.buffer, sys.stderr.buffer)
+    # One buffer per validator per stream, indexed like outputs
+    buffers = [(bytearray(), bytearray()) for _ in procs]
+    open_streams = [len(outputs)] * len(procs)
+    head = 0
+
+    def advance():
+        # Emit every validator that can now be reported in order
+        nonlocal head
+        while head < len(procs):
+            for out, buffer in zip(outputs, buffers[head]):
+                out.write(buffer)
+                buffer.clear()
+                out.flush()
+            if open_streams[head]:
+                return
+            head += 1
+            if head < len(procs):
+                print(f"\nRunning {validators[head][0]} validation...", flush=True)
+
+    print(f"\nRunning {validators[0][0]} validation...", flush=True)
+    with selectors.DefaultSelector() as selector:
+        for index, proc in enumerate(procs):
+            selector.register(proc.stdout, selectors.EVENT_READ, (index, 0))
+            selector.register(proc.stderr, selectors.EVENT_READ, (index, 1))
+        
+        while selector.get_map():
+            for key, _ in selector.select():
+                index, stream = key.data
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    buffers[index][stream].extend(chunk)
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    open_streams[index] -= 1
+                if index == head:
+                    advance()
+
+    return [proc.wait() for proc in procs]
+
 def validate_container(container_name):
     """Run all validators for a specific container."""
     validators = [
-        ("Container Structure", f"python3 scripts/validators/container_validator.py containers/{container_name}"),
-        ("Dockerfile", f"python3 scripts/validators/dockerfile_validator.py containers/{container_name}/Dockerfile"),
-        ("Poetry Configuration", f"python3 scripts/validators/poetry_validator.py containers/{container_name}"),
+        ("Container Structure", ["python3", "scripts/validators/container_validator.py", f"containers/{container_name}"]),
+        ("Dockerfile", ["python3", "scripts/validators/dockerfile_validator.py", f"containers/{container_name}/Dockerfile"]),
+        ("Poetry Configuration", ["python3", "scripts/validators/poetry_validator.py", f"containers/{container_name}"]),
     ]
     
     # Docker Compose validation is project-wide
-    validators.append(("Docker Compose", "python3 scripts/validators/compose_validator.py containers/dev-environment/docker-compose.dev.yml"))
+    validators.append(("Docker Compose", ["python3", "scripts/validators/compose_validator.py", "containers/dev-environment/docker-compose.dev.yml"]))
     
-    all_passed = True
-    for name, command in validators:
-        print(f"\nRunning {name} validation...")
-        result = subprocess.run(command, shell=True)
-        if result.returncode != 0:
-            all_passed = False
+    # The validators are independent processes, so run them all at once
+    returncodes = run_validators(validators)
+    all_passed = all(code == 0 for code in returncodes)
     
     return all_passed
 
@@ -2,22 +2,122 @@
 """Script to validate services against standardization templates."""
 
 import argparse
+import collections
+import contextlib
+import functools
+import json
 import os
 import subprocess
 import sys
+import threading
 import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import toml
 import yaml
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from validators.compose_validator import find_compose_file, load_compose_file, service_environment
+
 console = Console()
 
+REQUIRED_DOCKERFILE_COMPONENTS = (
+    "FROM python:3.11-slim",
+    "PYTHONUNBUFFERED=1",
+    "POETRY_VERSION",
+    "HEALTHCHECK",
+    "EXPOSE",
+    "CMD"
+)
+
+# The Dockerfile is searched as raw bytes, skipping the decode to str; each
+# component is one memmem-backed `in` test
+_REQUIRED_DOCKERFILE_BYTES = tuple(c.encode() for c in REQUIRED_DOCKERFILE_COMPONENTS)
+
+PYPROJECT_TEMPLATE_PATH = Path("docs/standards/python/PYPROJECT_TEMPLATE.toml")
+
+# Sections every service pyproject.toml must define, pre-split into key paths
+_REQUIRED_SECTIONS = tuple(
+    tuple(section.split("."))
+    for section in (
+        "tool.poetry",
+        "tool.poetry.dependencies",
+        "tool.poetry.group.dev.dependencies",
+        "build-system",
+        "tool.pytest.ini_options",
+        "tool.black",
+        "tool.isort",
+        "tool.mypy",
+        "tool.coverage.run",
+        "tool.coverage.report"
+    )
+)
+
+@functools.lru_cache(maxsize=1)
+def _parse_pyproject_template(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse the template; mtime_ns is part of the cache key so edits invalidate it."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+def load_pyproject_template() -> Dict[str, Any]:
+    """Load the pyproject.toml template, parsing it only when it changes."""
+    return _parse_pyproject_template(
+        PYPROJECT_TEMPLATE_PATH,
+        PYPROJECT_TEMPLATE_PATH.stat().st_mtime_ns
+    )
+
+ENV_EXAMPLE_PATH = Path(".env.example")
+
+# Lines of test output kept for the error report when tests fail
+TEST_OUTPUT_TAIL = 200
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_example(path: Path, mtime_ns: int) -> Tuple[str, ...]:
+    """Parse variable names from an env file; mtime_ns keys the cache."""
+    with open(path) as f:
+        return tuple(
+            line.split("=")[0]
+            for line in map(str.strip, f)
+            if line and not line.startswith("#")
+        )
+
+def required_env_vars() -> Tuple[str, ...]:
+    """Names of the variables listed in .env.example, re-read only when it changes."""
+    return _parse_env_example(ENV_EXAMPLE_PATH, ENV_EXAMPLE_PATH.stat().st_mtime_ns)
+
+@functools.lru_cache(maxsize=1)
+def _compose_state() -> Dict[str, Dict[str, Any]]:
+    """State of every compose service from one `docker compose ps` call, keyed by service.
+
+    Call _compose_state.cache_clear() to refresh it between polls.
+    """
+    result = subprocess.run(
+        ["docker", "compose", "ps", "--format", "json"],
+        capture_output=True,
+        check=False
+    )
+    output = result.stdout.strip()
+    if result.returncode != 0 or not output:
+        return {}
+    # Older Compose releases print one JSON array, newer ones one object per line
+    if output.startswith(b"["):
+        rows = json.loads(output)
+    else:
+        rows = [json.loads(line) for line in output.splitlines() if line.strip()]
+    return {row["Service"]: row for row in rows if "Service" in row}
+
+def _entry_names(path: Path) -> set:
+    """Return the names in a directory from one scandir, or an empty set if it's missing."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 class ServiceValidator:
     """Validates a service against standardization templates."""
     
@@ -27,10 +127,43 @@ class ServiceValidator:
         self.service_name = self.service_path.name
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # Checks may run concurrently; each worker thread records into its
+        # own lists (see _run_check), which validate() merges in check order
+        self._local = threading.local()
+        self._concurrent = False
+    
+    def _add_error(self, *messages: str) -> None:
+        """Record one or more related errors."""
+        getattr(self._local, "errors", self.errors).extend(messages)
+    
+    def _add_warning(self, message: str) -> None:
+        """Record a warning."""
+        getattr(self._local, "warnings", self.warnings).append(message)
+    
+    def _run_check(self, check: Callable[[], bool]) -> Tuple[bool, List[str], List[str]]:
+        """Run one check on the current thread, returning (passed, errors, warnings)."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        self._local.errors = errors
+        self._local.warnings = warnings
+        try:
+            return check(), errors, warnings
+        finally:
+            del self._local.errors, self._local.warnings
+    
+    def _status(self, message: str):
+        """Show a spinner for a single check, unless checks run concurrently.
+
+        Rich allows only one live display at a time, so validate() shows a
+        single spinner for the whole concurrent run instead.
+        """
+        if self._concurrent:
+            return contextlib.nullcontext()
+        return console.status(message)
     
     def validate_structure(self) -> bool:
         """Validate service directory structure."""
-        with console.status("[bold blue]Validating service structure..."):
+        with self._status("[bold blue]Validating service structure..."):
             required_files = [
                 "Dockerfile",
                 "pyproject.toml",
@@ -39,215 +172,210 @@ class ServiceValidator:
                 "README.md"
             ]
             
+            # One directory read answers every membership check below
+            top_level = _entry_names(self.service_path)
             missing_files = [
                 f for f in required_files 
-                if not (self.service_path / f).exists()
+                if f not in top_level
             ]
             
             if missing_files:
-                self.errors.append(f"Missing required files/directories: {', '.join(missing_files)}")
+                self._add_error(f"Missing required files/directories: {', '.join(missing_files)}")
                 return False
             
             # Check src directory structure
             src_dir = self.service_path / "src" / self.service_name
-            if not src_dir.exists():
-                self.errors.append(f"Missing source directory: {src_dir}")
+            if self.service_name not in _entry_names(src_dir.parent):
+                self._add_error(f"Missing source directory: {src_dir}")
                 return False
             
             # Check tests structure
             tests_dir = self.service_path / "tests"
             required_test_dirs = ["unit", "integration"]
+            test_entries = _entry_names(tests_dir)
             missing_test_dirs = [
                 d for d in required_test_dirs 
-                if not (tests_dir / d).exists()
+                if d not in test_entries
             ]
             if missing_test_dirs:
-                self.warnings.append(f"Missing test directories: {', '.join(missing_test_dirs)}")
+                self._add_warning(f"Missing test directories: {', '.join(missing_test_dirs)}")
             
             return True
     
     def validate_pyproject_toml(self) -> bool:
         """Validate pyproject.toml against template."""
-        with console.status("[bold blue]Validating pyproject.toml..."):
+        with self._status("[bold blue]Validating pyproject.toml..."):
             try:
                 # Read service pyproject.toml
                 pyproject_path = self.service_path / "pyproject.toml"
-                with open(pyproject_path) as f:
-                    service_pyproject = toml.load(f)
+                with open(pyproject_path, "rb") as f:
+                    service_pyproject = tomllib.load(f)
                 
                 # Read template
-                template_path = Path("docs/standards/python/PYPROJECT_TEMPLATE.toml")
-                with open(template_path) as f:
-                    template = toml.load(f)
+                template = load_pyproject_template()
                 
                 # Check required sections
-                required_sections = [
-                    "tool.poetry",
-                    "tool.poetry.dependencies",
-                    "tool.poetry.group.dev.dependencies",
-                    "build-system",
-                    "tool.pytest.ini_options",
-                    "tool.black",
-                    "tool.isort",
-                    "tool.mypy",
-                    "tool.coverage.run",
-                    "tool.coverage.report"
-                ]
-                
-                for section in required_sections:
-                    parts = section.split(".")
+                for path in _REQUIRED_SECTIONS:
                     current = service_pyproject
-                    for part in parts:
-                        if part not in current:
-                            self.errors.append(f"Missing required section in pyproject.toml: {section}")
+                    for part in path:
+                        current = current.get(part) if isinstance(current, dict) else None
+                        if current is None:
+                            self._add_error(f"Missing required section in pyproject.toml: {'.'.join(path)}")
                             return False
-                        current = current[part]
                 
                 return True
                 
             except Exception as e:
-                self.errors.append(f"Error validating pyproject.toml: {str(e)}")
+                self._add_error(f"Error validating pyproject.toml: {str(e)}")
                 return False
     
     def validate_dockerfile(self) -> bool:
         """Validate Dockerfile against template."""
-        with console.status("[bold blue]Validating Dockerfile..."):
+        with self._status("[bold blue]Validating Dockerfile..."):
             try:
                 # Read service Dockerfile
                 dockerfile_path = self.service_path / "Dockerfile"
-                with open(dockerfile_path) as f:
+                with open(dockerfile_path, "rb") as f:
                     service_dockerfile = f.read()
                 
-                # Read template
-                template_path = Path("docs/standards/docker/DOCKERFILE_TEMPLATE")
-                with open(template_path) as f:
-                    template = f.read()
-                
                 # Check for required components
-                required_components = [
-                    "FROM python:3.11-slim",
-                    "PYTHONUNBUFFERED=1",
-                    "POETRY_VERSION",
-                    "HEALTHCHECK",
-                    "EXPOSE",
-                    "CMD"
-                ]
-                
-                for component in required_components:
-                    if component not in service_dockerfile:
-                        self.errors.append(f"Missing required component in Dockerfile: {component}")
+                for component, component_bytes in zip(REQUIRED_DOCKERFILE_COMPONENTS, _REQUIRED_DOCKERFILE_BYTES):
+                    if component_bytes not in service_dockerfile:
+                        self._add_error(f"Missing required component in Dockerfile: {component}")
                         return False
                 
                 return True
                 
             except Exception as e:
-                self.errors.append(f"Error validating Dockerfile: {str(e)}")
+                self._add_error(f"Error validating Dockerfile: {str(e)}")
                 return False
     
     def check_environment_variables(self) -> bool:
         """Check if all required environment variables are set."""
-        with console.status("[bold blue]Checking environment variables..."):
+        with self._status("[bold blue]Checking environment variables..."):
             try:
-                # Read .env.example
-                env_example_path = Path(".env.example")
-                required_vars = []
-                
-                with open(env_example_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            var_name = line.split("=")[0]
-                            required_vars.append(var_name)
-                
-                # Check if variables are set in environment
+                # Check if variables are set (and non-empty) in environment
+                environ = os.environ
                 missing_vars = [
-                    var for var in required_vars 
-                    if not os.getenv(var)
+                    var for var in required_env_vars()
+                    if not environ.get(var)
                 ]
                 
                 if missing_vars:
-                    self.warnings.append(f"Missing environment variables: {', '.join(missing_vars)}")
+                    self._add_warning(f"Missing environment variables: {', '.join(missing_vars)}")
                     return False
                 
                 return True
                 
             except Exception as e:
-                self.errors.append(f"Error checking environment variables: {str(e)}")
+                self._add_error(f"Error checking environment variables: {str(e)}")
                 return False
     
+    def _container_id(self) -> Optional[str]:
+        """Resolve the service's container ID, or None if it isn't running."""
+        result = subprocess.run(
+            ["docker", "compose", "ps", "-q", self.service_name],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        container_id = result.stdout.strip().split("\n")[0]
+        return container_id if result.returncode == 0 and container_id else None
+    
+    def _health_status(self) -> str:
+        """Current health status of the service's container, or '' if unknown.
+
+        Uses the shared `docker compose ps` snapshot and only falls back to
+        `docker inspect` when the snapshot has no health for this service.
+        """
+        row = _compose_state().get(self.service_name)
+        if row and row.get("Health"):
+            return row["Health"]
+        
+        container_id = row.get("ID") if row else self._container_id()
+        if not container_id:
+            return ""
+        result = subprocess.run(
+            ["docker", "inspect", "--format", "{{.State.Health.Status}}", container_id],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        return result.stdout.strip() if result.returncode == 0 else ""
+    
     def check_container_health(self, timeout: int = 60) -> bool:
-        """Check if service containers are healthy using docker-compose."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
+        """Check if service containers are healthy using docker compose/inspect."""
+        with self._status("[bold blue]Checking container health..."):
             try:
-                task = progress.add_task(
-                    description="[bold blue]Checking container health...",
-                    total=None
-                )
-                
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    # Use docker-compose ps to check container status
-                    result = subprocess.run(
-                        ["./dev", "ps", self.service_name],
-                        capture_output=True,
-                        text=True,
-                        check=False
-                    )
-                    
-                    if result.returncode != 0:
-                        time.sleep(1)
-                        continue
-                    
-                    # Check if container is running and healthy
-                    if "Up" in result.stdout and "(healthy)" in result.stdout:
+                attempt = 0
+                start_time = time.monotonic()
+                while time.monotonic() - start_time < timeout:
+                    status = self._health_status()
+                    if status == "healthy":
                         return True
-                    elif "Up" in result.stdout and "(unhealthy)" in result.stdout:
-                        self.errors.append("Container health check failed")
+                    elif status == "unhealthy":
+                        self._add_error("Container health check failed")
                         return False
                     
-                    time.sleep(1)
+                    # Back off exponentially: 100ms, 200ms, 400ms, ... capped at 2s
+                    time.sleep(min(2.0, 0.1 * 2 ** attempt))
+                    attempt += 1
+                    _compose_state.cache_clear()
                 
-                self.errors.append("Container health check timed out")
+                self._add_error("Container health check timed out")
                 return False
                 
             except Exception as e:
-                self.errors.append(f"Error checking container health: {str(e)}")
+                self._add_error(f"Error checking container health: {str(e)}")
                 return False
     
     def run_tests(self) -> bool:
         """Run service tests."""
-        with console.status("[bold blue]Running tests..."):
+        with self._status("[bold blue]Running tests..."):
             try:
-                # Run tests using run_tests.py as per testing rules
-                result = subprocess.run(
+                # Run tests using run_tests.py as per testing rules, echoing
+                # output as it arrives and keeping only the tail in memory
+                proc = subprocess.Popen(
                     [
                         "python", "run_tests.py", 
                         self.service_name, 
                         "--type", "unit", 
                         "--extra", "--asyncio-mode=auto --log-cli-level=INFO"
                     ],
-                    capture_output=True,
-                    text=True
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1
                 )
+                tail = collections.deque(maxlen=TEST_OUTPUT_TAIL)
+                with proc.stdout:
+                    for line in proc.stdout:
+                        tail.append(line)
+                        console.print(line, end="", markup=False, highlight=False)
                 
-                if result.returncode != 0:
-                    self.errors.append("Tests failed:")
-                    self.errors.append(result.stderr)
+                if proc.wait() != 0:
+                    self._add_error("Tests failed:", "".join(tail))
                     return False
                 
                 return True
                 
             except Exception as e:
-                self.errors.append(f"Error running tests: {str(e)}")
+                self._add_error(f"Error running tests: {str(e)}")
                 return False
     
     def check_python_path(self) -> Tuple[bool, Optional[str]]:
-        """Check PYTHONPATH configuration."""
+        """Check PYTHONPATH configuration.
+
+        Uses the PYTHONPATH declared in the compose file when there is one,
+        and only execs into the container to print sys.path otherwise.
+        """
         try:
+            compose_file = find_compose_file()
+            if compose_file:
+                env = service_environment(load_compose_file(compose_file), self.service_name)
+                if env.get("PYTHONPATH"):
+                    return True, "\n".join(env["PYTHONPATH"].split(":"))
+            
             result = subprocess.run(
                 [
                     "docker", "compose", "exec",
@@ -265,7 +393,7 @@ class ServiceValidator:
             return True, result.stdout
             
         except Exception as e:
-            self.errors.append(f"Error checking PYTHONPATH: {str(e)}")
+            self._add_error(f"Error checking PYTHONPATH: {str(e)}")
             return False, None
     
     def validate(self) -> bool:
@@ -285,10 +413,24 @@ class ServiceValidator:
         table.add_column("Check", style="cyan")
         table.add_column("Status", style="bold")
         
+        # The checks are independent and I/O-bound, so run them concurrently
+        # and fill in the table in the original order
+        self._concurrent = True
+        try:
+            with console.status("[bold blue]Running validations..."):
+                with ThreadPoolExecutor(max_workers=len(validations)) as executor:
+                    futures = [(name, executor.submit(self._run_check, func)) for name, func in validations]
+        finally:
+            self._concurrent = False
+        
+        # Merge each check's messages in check order, so the report doesn't
+        # depend on which thread finished first
         all_passed = True
-        for name, func in validations:
+        for name, future in futures:
             try:
-                passed = func()
+                passed, errors, warnings = future.result()
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
                 status = "[green]✓ Passed" if passed else "[red]✗ Failed"
                 table.add_row(name, status)
                 all_passed = all_passed and passed
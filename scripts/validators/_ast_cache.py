@@ -0,0 +1,122 @@
+"""
+AST Analysis Cache
+
+Persists the per-file findings the validators extract from Python ASTs in a
+SQLite database, keyed by file path and SHA-256 of the file's content, so
+unchanged files are not re-parsed on later runs. Only the small summaries the
+validators consume are stored, never full trees.
+"""
+
+import json
+import sqlite3
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+try:
+    from ._cache import CACHE_DIR
+except ImportError:
+    from _cache import CACHE_DIR
+
+CACHE_PATH = CACHE_DIR / "ast_cache.sqlite3"
+
+# Bump whenever the summaries table or what SourceSummary records changes;
+# a database stamped with another version is dropped and rebuilt
+SCHEMA_VERSION = 1
+
+# sqlite3 connections may only be used on the thread that opened them, and
+# the validators run on worker threads, so each thread gets its own
+_local = threading.local()
+
+
+class SourceSummary(NamedTuple):
+    """Findings from one Python source file."""
+    has_all: bool
+    has_importfrom: bool
+    # (level, module) for every relative or deprecated 'from X import'
+    # statement, in source order
+    import_findings: Tuple[Tuple[int, str], ...]
+
+
+def _connection() -> Optional[sqlite3.Connection]:
+    """Return this thread's cache connection, or None if it can't be used."""
+    try:
+        return _local.conn
+    except AttributeError:
+        pass
+    _local.conn = _open()
+    return _local.conn
+
+
+def _schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version stamped on the cache database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _open() -> Optional[sqlite3.Connection]:
+    """Open the cache database, or return None if it can't be used."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if _schema_version(conn) != SCHEMA_VERSION:
+            # Re-check under the write lock so concurrent openers rebuild once
+            conn.execute("BEGIN IMMEDIATE")
+            if _schema_version(conn) != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS summaries")
+                conn.execute(
+                    "CREATE TABLE summaries ("
+                    " path TEXT PRIMARY KEY,"
+                    " sha BLOB NOT NULL,"
+                    " has_all INTEGER NOT NULL,"
+                    " has_importfrom INTEGER NOT NULL,"
+                    " import_findings BLOB NOT NULL)"
+                )
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def lookup(path: str, sha: bytes) -> Optional[SourceSummary]:
+    """Return the cached summary for path if its content hash still matches."""
+    conn = _connection()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT has_all, has_importfrom, import_findings FROM summaries"
+            " WHERE path = ? AND sha = ?",
+            (path, sha)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    has_all, has_importfrom, import_findings = row
+    return SourceSummary(
+        bool(has_all),
+        bool(has_importfrom),
+        tuple((level, module) for level, module in json.loads(import_findings))
+    )
+
+
+def store(path: str, sha: bytes, summary: SourceSummary) -> None:
+    """Record the summary for path, replacing any entry for older content."""
+    conn = _connection()
+    if conn is None:
+        return
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+            (
+                path,
+                sha,
+                int(summary.has_all),
+                int(summary.has_importfrom),
+                json.dumps(summary.import_findings).encode("utf-8"),
+            )
+        )
+    except sqlite3.Error:
+        pass
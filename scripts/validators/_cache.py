@@ -0,0 +1,50 @@
+"""
+Shared On-Disk Cache Helpers
+
+Location of the per-user cache directory used by every script, plus a helper
+that pickles a parsed result next to it and reuses it while the source files
+it was built from are unchanged.
+"""
+
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Sequence, Tuple
+
+CACHE_DIR = Path.home() / ".cache" / "cursor-guardrails"
+
+
+def source_stamp(paths: Sequence[Path]) -> Tuple:
+    """Build a cache key from the path, mtime and size of each source file."""
+    stamp = []
+    for path in paths:
+        stat = path.stat()
+        stamp.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def cached_pickle(key: str, paths: Sequence[Path], loader: Callable[[], Any]) -> Any:
+    """Return loader()'s result, reusing CACHE_DIR/<key>.pkl while paths are unchanged.
+
+    A missing, truncated or corrupt cache file is treated as a miss; a cache
+    that can't be written is skipped.
+    """
+    stamp = source_stamp(paths)
+    cache_path = CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, value = pickle.load(f)
+        if cached_stamp == stamp:
+            return value
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    value = loader()
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump((stamp, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return value
@@ -9,9 +9,22 @@ import sys
 import json
 import logging
 import argparse
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
 
+try:
+    import httpx
+except ImportError:  # fall back to requests
+    httpx = None
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +44,25 @@ REQUIRED_HEADERS = [
     "X-RateLimit-Reset"
 ]
 
+# Shared client so every endpoint reuses pooled keep-alive connections
+if httpx is not None:
+    _LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+    try:
+        _SESSION = httpx.Client(http2=True, timeout=5.0, limits=_LIMITS, follow_redirects=True)
+    except ImportError:  # HTTP/2 support (h2) not installed
+        _SESSION = httpx.Client(timeout=5.0, limits=_LIMITS, follow_redirects=True)
+    _REQUEST_ERRORS = (httpx.HTTPError,)
+else:
+    _SESSION = requests.Session()
+    _ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=0))
+    _SESSION.mount("http://", _ADAPTER)
+    _SESSION.mount("https://", _ADAPTER)
+    _REQUEST_ERRORS = (requests.RequestException,)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the latter with either parser
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 def validate_response_format(response_json: Dict[str, Any]) -> List[str]:
     """
     Validate API response format against standards.
@@ -96,7 +128,7 @@ def validate_api_endpoint(base_url: str, endpoint: str) -> List[str]:
     url = f"{base_url}{endpoint}"
     
     try:
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
         
         # Check status code
         if response.status_code != 200:
@@ -109,13 +141,13 @@ def validate_api_endpoint(base_url: str, endpoint: str) -> List[str]:
         
         # Validate response format
         try:
-            response_json = response.json()
+            response_json = _json_loads(response.content)
             format_errors = validate_response_format(response_json)
             errors.extend(format_errors)
         except json.JSONDecodeError:
             errors.append(f"Endpoint {endpoint} did not return valid JSON")
         
-    except requests.RequestException as e:
+    except _REQUEST_ERRORS as e:
         errors.append(f"Error connecting to {endpoint}: {str(e)}")
     
     return errors
@@ -132,11 +164,16 @@ def validate_api(base_url: str) -> Tuple[bool, List[str]]:
     """
     all_errors = []
     
-    # Validate required endpoints
-    for endpoint in REQUIRED_ENDPOINTS:
+    def validate_endpoint(endpoint: str) -> List[str]:
+        # Logged from the worker so the line appears when the request starts
         logger.info(f"Validating endpoint: {endpoint}")
-        errors = validate_api_endpoint(base_url, endpoint)
-        
+        return validate_api_endpoint(base_url, endpoint)
+    
+    # Validate required endpoints concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_ENDPOINTS)) as executor:
+        results = list(executor.map(validate_endpoint, REQUIRED_ENDPOINTS))
+    
+    for endpoint, errors in zip(REQUIRED_ENDPOINTS, results):
         if errors:
             all_errors.append(f"Endpoint {endpoint} has issues:")
             for error in errors:
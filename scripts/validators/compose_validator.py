@@ -7,12 +7,19 @@ ensuring consistent service configuration and integration.
 """
 
 import sys
+import re
 import yaml
+import functools
 import logging
 import argparse
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +27,118 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Substrings of service names that suggest a Python service
+PYTHON_SERVICE_INDICATORS = (
+    'python', 'django', 'flask', 'fastapi', 'celery', 
+    'worker', 'api', 'service', 'app', 'backend',
+    'foundation', 'agent', 'model', 'processor', 'analyzer'
+)
+_PY_SVC_RE = re.compile("|".join(map(re.escape, PYTHON_SERVICE_INDICATORS)))
+
+# Default compose file names, in the order docker compose looks for them
+COMPOSE_FILE_NAMES = ("compose.yaml", "compose.yml", "docker-compose.yaml", "docker-compose.yml")
+
+@functools.lru_cache(maxsize=None)
+def load_compose_file(compose_file: str) -> Dict[str, Any]:
+    """Parse a compose file once per process; shared by the validators."""
+    with open(compose_file, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+def find_compose_file(directory: str = ".") -> Optional[str]:
+    """Return the compose file docker compose would use in directory, if any."""
+    for name in COMPOSE_FILE_NAMES:
+        path = Path(directory) / name
+        if path.is_file():
+            return str(path)
+    return None
+
+def service_environment(compose_data: Dict[str, Any], service_name: str) -> Dict[str, str]:
+    """Return a service's statically declared environment as a dict.
+
+    Compose allows both a mapping and a list of KEY=VALUE strings.
+    """
+    service = (compose_data.get('services') or {}).get(service_name) or {}
+    env = service.get('environment') or {}
+    if isinstance(env, dict):
+        return {str(k): '' if v is None else str(v) for k, v in env.items()}
+    return {
+        key: value
+        for key, _, value in (str(item).partition('=') for item in env)
+    }
+
+def _check_build(errors: List[str], service_name: str, build: Any, python_service: bool) -> None:
+    """Check build context is component-based and Poetry build args are set."""
+    if not isinstance(build, dict):
+        return
+
+    # Validate context follows pattern
+    if 'context' in build:
+        context = build['context']
+        # Special case for dev container
+        if service_name == "dev":
+            if not (context == "./containers/dev-environment" or context == "." or context == "../.."):
+                errors.append(f"Dev container build context should be './containers/dev-environment', '.' or '../..'")
+
+            # Special case for dev container dockerfile path
+            if 'dockerfile' in build:
+                if not (build['dockerfile'] == "Dockerfile" or build['dockerfile'] == "containers/dev-environment/Dockerfile"):
+                    errors.append(f"Dev container dockerfile should be 'Dockerfile' or 'containers/dev-environment/Dockerfile'")
+        else:
+            if not (context == f"./containers/{service_name}" or context == "."):
+                errors.append(f"Build context should be './containers/{service_name}' or '.'")
+
+            # If using component-specific context, validate dockerfile is at root
+            if context == f"./containers/{service_name}" and 'dockerfile' in build:
+                if build['dockerfile'] != "Dockerfile":
+                    errors.append(f"When using component context, dockerfile should be 'Dockerfile'")
+
+            # If using root context, validate dockerfile includes component path
+            if context == "." and 'dockerfile' in build:
+                if not build['dockerfile'].startswith(f"containers/{service_name}/"):
+                    errors.append(f"When using root context, dockerfile should include component path")
+
+    # Check for Poetry-related args in build configuration
+    args = build.get('args')
+    if python_service and isinstance(args, dict):
+        if not any('poetry' in arg.lower() for arg in args):
+            errors.append(f"Python service {service_name} should include Poetry-related build args")
+
+def _check_volumes(errors: List[str], service_name: str, volumes: Any, python_service: bool) -> None:
+    """Check for volumes mounting Poetry configuration."""
+    if not python_service or not isinstance(volumes, list):
+        return
+
+    poetry_volume_found = any(
+        isinstance(volume, str) and ('pyproject.toml' in volume or 'poetry.lock' in volume)
+        for volume in volumes
+    )
+    if not poetry_volume_found:
+        errors.append(f"Python service {service_name} should mount pyproject.toml/poetry.lock for development")
+        errors.append(f"  Consider adding: './containers/{service_name}/pyproject.toml:/app/pyproject.toml'")
+
+def _check_environment(errors: List[str], service_name: str, env_vars: Any, python_service: bool) -> None:
+    """Check for environment variables related to Python/Poetry."""
+    if not python_service:
+        return
+
+    if isinstance(env_vars, list):
+        python_path_found = any('PYTHONPATH' in env for env in env_vars if isinstance(env, str))
+    elif isinstance(env_vars, dict):
+        python_path_found = 'PYTHONPATH' in env_vars
+    else:
+        python_path_found = False
+
+    if not python_path_found:
+        errors.append(f"Python service {service_name} should define PYTHONPATH environment variable")
+
+# Per-key checks for a service entry, run in this order so errors are
+# reported consistently regardless of key order in the file
+SERVICE_CHECKS = (
+    ('build', _check_build),
+    ('volumes', _check_volumes),
+    ('environment', _check_environment),
+)
+
 def validate_compose_service(service_name: str, service_config: Dict[str, Any]) -> List[str]:
     """
     Validate a single service entry in docker-compose.yml.
@@ -32,81 +151,21 @@ def validate_compose_service(service_name: str, service_config: Dict[str, Any])
         List of error messages, empty list if valid
     """
     errors = []
+    python_service = is_python_service(service_name)
 
-    # Check build context is component-based
-    if 'build' in service_config:
-        build = service_config['build']
-        if isinstance(build, dict):
-            # Validate context follows pattern
-            if 'context' in build:
-                context = build['context']
-                # Special case for dev container
-                if service_name == "dev":
-                    if not (context == "./containers/dev-environment" or context == "." or context == "../.."):
-                        errors.append(f"Dev container build context should be './containers/dev-environment', '.' or '../..'")
-
-                    # Special case for dev container dockerfile path
-                    if 'dockerfile' in build:
-                        if not (build['dockerfile'] == "Dockerfile" or build['dockerfile'] == "containers/dev-environment/Dockerfile"):
-                            errors.append(f"Dev container dockerfile should be 'Dockerfile' or 'containers/dev-environment/Dockerfile'")
-                else:
-                    if not (context == f"./containers/{service_name}" or context == "."):
-                        errors.append(f"Build context should be './containers/{service_name}' or '.'")
-
-                    # If using component-specific context, validate dockerfile is at root
-                    if context == f"./containers/{service_name}" and 'dockerfile' in build:
-                        if build['dockerfile'] != "Dockerfile":
-                            errors.append(f"When using component context, dockerfile should be 'Dockerfile'")
-
-                    # If using root context, validate dockerfile includes component path
-                    if context == "." and 'dockerfile' in build:
-                        if not build['dockerfile'].startswith(f"containers/{service_name}/"):
-                            errors.append(f"When using root context, dockerfile should include component path")
-
-            # Check for Poetry-related args in build configuration
-            if 'args' in build and isinstance(build['args'], dict):
-                poetry_args = [arg for arg in build['args'] if 'poetry' in arg.lower()]
-                if not poetry_args and is_python_service(service_name):
-                    errors.append(f"Python service {service_name} should include Poetry-related build args")
-
-    # Check for volumes mounting Poetry configuration
-    if 'volumes' in service_config and isinstance(service_config['volumes'], list):
-        poetry_volume_found = False
-        for volume in service_config['volumes']:
-            if isinstance(volume, str) and ('pyproject.toml' in volume or 'poetry.lock' in volume):
-                poetry_volume_found = True
-                break
-        
-        if not poetry_volume_found and is_python_service(service_name):
-            errors.append(f"Python service {service_name} should mount pyproject.toml/poetry.lock for development")
-            errors.append(f"  Consider adding: './containers/{service_name}/pyproject.toml:/app/pyproject.toml'")
-
-    # Check for environment variables related to Python/Poetry
-    if 'environment' in service_config:
-        env_vars = service_config['environment']
-        if isinstance(env_vars, list):
-            python_path_found = any('PYTHONPATH' in env for env in env_vars if isinstance(env, str))
-        elif isinstance(env_vars, dict):
-            python_path_found = 'PYTHONPATH' in env_vars
-        else:
-            python_path_found = False
-            
-        if not python_path_found and is_python_service(service_name):
-            errors.append(f"Python service {service_name} should define PYTHONPATH environment variable")
+    for key, check in SERVICE_CHECKS:
+        if key in service_config:
+            check(errors, service_name, service_config[key], python_service)
 
     return errors
 
+@functools.lru_cache(maxsize=256)
 def is_python_service(service_name: str) -> bool:
     """
     Determine if a service is likely a Python service based on name.
     This is a heuristic and may need improvement for specific projects.
     """
-    python_service_indicators = [
-        'python', 'django', 'flask', 'fastapi', 'celery', 
-        'worker', 'api', 'service', 'app', 'backend',
-        'foundation', 'agent', 'model', 'processor', 'analyzer'
-    ]
-    return any(indicator in service_name.lower() for indicator in python_service_indicators)
+    return _PY_SVC_RE.search(service_name.lower()) is not None
 
 def validate_compose_file(compose_file: str) -> List[str]:
     """
@@ -119,8 +178,7 @@ def validate_compose_file(compose_file: str) -> List[str]:
         List of error messages, empty list if valid
     """
     try:
-        with open(compose_file, 'r') as f:
-            compose_data = yaml.safe_load(f)
+        compose_data = load_compose_file(compose_file)
 
         if not compose_data or 'services' not in compose_data:
             return ["Invalid docker-compose.yml: missing services section"]
@@ -9,11 +9,20 @@ ensuring consistent organization and file presence.
 import sys
 import logging
 import ast
+import functools
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import os
 from typing import List, Optional, Tuple
 import black
 
+try:
+    from . import _ast_cache
+except ImportError:
+    import _ast_cache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,7 +31,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Directories to exclude from validation
-EXCLUDED_DIRS = {
+EXCLUDED_DIRS = frozenset({
     '__pycache__',
     'common',
     'tools',
@@ -38,42 +47,96 @@ EXCLUDED_DIRS = {
     '.mypy_cache',
     '.tox',
     '.eggs',
-}
+})
 
-def should_skip_directory(dir_path: Path) -> bool:
-    """Check if a directory should be skipped during validation."""
-    return (
-    any(part.startswith('.') for part in dir_path.parts) or
-    any(part in EXCLUDED_DIRS for part in dir_path.parts)
-    )
+# Every scanned path has a separator before its name, so a suffix test is
+# enough to spot package __init__ files
+_INIT_SUFFIX = os.sep + "__init__.py"
 
-def format_python_files(container_path: Path) -> List[str]:
-    """Format all Python files in the container using black."""
-    errors = []
-    mode = black.Mode(
+# black settings shared by every container validated in this process
+BLACK_MODE = black.Mode(
     target_versions={black.TargetVersion.PY311},
     line_length=88,
     string_normalization=True,
     is_pyi=False,
-    )
-
-    for py_file in container_path.rglob("*.py"):
-        if not should_skip_directory(py_file.parent):
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    src = f.read()
-                try:
-                    formatted_src = black.format_str(src, mode=mode)
-                    with open(py_file, 'w', encoding='utf-8') as f:
-                        f.write(formatted_src)
-                except black.InvalidInput as e:
-                    errors.append(f"Syntax error in {py_file}: {str(e)}")
-            except Exception as e:
-                errors.append(f"Error reading/writing {py_file}: {str(e)}")
+)
 
-    return errors
+# Containers that may not need a Dockerfile
+UTILITY_CONTAINERS = frozenset({'common', 'tools', 'monitoring', 'resource_monitor'})
 
-def validate_container_structure(container_path: Path) -> List[str]:
+def should_skip_directory(dir_path: Path, _excluded=EXCLUDED_DIRS) -> bool:
+    """Check if a directory should be skipped during validation."""
+    for part in dir_path.parts:
+        if part[:1] == '.' or part in _excluded:
+            return True
+    return False
+
+@functools.lru_cache(maxsize=None)
+def scan_container(container_path: Path) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Walk a container once, returning (python_files, subdirectories).
+
+    Hidden and excluded directories are pruned at the DirEntry level, so
+    their contents are never listed. Entries are kept as path strings; callers
+    build Path objects only for the files they go on to read. The result is
+    cached per container and shared by every check below.
+    """
+    py_files = []
+    subdirs = []
+    stack = [os.fspath(container_path)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not (entry.name.startswith('.') or entry.name in EXCLUDED_DIRS):
+                        subdirs.append(entry.path)
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    py_files.append(entry.path)
+    return tuple(py_files), tuple(subdirs)
+
+def _under(paths: Tuple[str, ...], root: Path) -> List[str]:
+    """Select the paths that lie strictly below root."""
+    prefix = os.path.join(os.fspath(root), '')
+    return [p for p in paths if p.startswith(prefix)]
+
+def _format_one(py_file: str, mode: black.Mode) -> Optional[str]:
+    """Format a single file with black, returning an error message on failure."""
+    try:
+        with open(py_file, 'r', encoding='utf-8') as f:
+            src = f.read()
+        try:
+            formatted_src = black.format_str(src, mode=mode)
+            # Leave already-formatted files untouched so their mtime survives
+            if formatted_src != src:
+                with open(py_file, 'w', encoding='utf-8') as f:
+                    f.write(formatted_src)
+        except black.InvalidInput as e:
+            return f"Syntax error in {py_file}: {str(e)}"
+    except Exception as e:
+        return f"Error reading/writing {py_file}: {str(e)}"
+    return None
+
+def format_python_files(py_files: List[str], mode: black.Mode = BLACK_MODE) -> List[str]:
+    """Format the given Python files using black, spread across CPU cores.
+
+    Callers that already run containers on a thread pool (check_standards)
+    get serial formatting instead, so concurrent containers don't each fork a
+    process pool from a multithreaded process.
+    """
+    if len(py_files) <= 1 or threading.current_thread() is not threading.main_thread():
+        results = [_format_one(py_file, mode) for py_file in py_files]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(
+                _format_one,
+                py_files,
+                [mode] * len(py_files),
+                chunksize=8
+            ))
+
+    return [error for error in results if error is not None]
+
+def validate_container_structure(container_path: Path, mode: black.Mode = BLACK_MODE) -> List[str]:
     """Validate an individual container's structure and organization."""
     errors = []
     container_name = container_path.name
@@ -82,10 +145,13 @@ def validate_container_structure(container_path: Path) -> List[str]:
     if container_name in EXCLUDED_DIRS:
         return []
 
+    # Walk the container once and share the listing with every check
+    py_files, subdirs = scan_container(container_path)
+    python_code = has_python_code(container_path)
+
     # First format all Python files
-    if has_python_code(container_path):
-        logger.info("Formatting Python files with black...")
-        format_errors = format_python_files(container_path)
+    if python_code:
+        format_errors = format_python_files(list(py_files), mode)
         errors.extend(format_errors)
 
     # Continue with regular validation
@@ -96,11 +162,13 @@ def validate_container_structure(container_path: Path) -> List[str]:
                 errors.append(f"Missing required file: Dockerfile")
 
         # Check Python package structure
-        if has_python_code(container_path):
+        if python_code:
             # Check src directory structure
             src_path = container_path / "src"
             if src_path.exists():
-                errors.extend(validate_python_package(src_path, container_name))
+                errors.extend(validate_python_package(
+                    src_path, container_name, _under(py_files, src_path), _under(subdirs, src_path)
+                ))
 
             # Check tests directory structure
             tests_path = container_path / "tests"
@@ -108,7 +176,9 @@ def validate_container_structure(container_path: Path) -> List[str]:
                 if not (tests_path / "__init__.py").exists():
                     errors.append(f"Missing __init__.py in tests directory")
                 else:
-                    errors.extend(validate_python_package(tests_path, "tests"))
+                    errors.extend(validate_python_package(
+                        tests_path, "tests", _under(py_files, tests_path), _under(subdirs, tests_path)
+                    ))
         
         # Poetry validation - Check for pyproject.toml and absence of requirements.txt/setup.py
         poetry_errors = validate_poetry_configuration(container_path)
@@ -136,9 +206,16 @@ def validate_poetry_configuration(container_path: Path) -> List[str]:
     
     return errors
 
-def validate_python_package(package_path: Path, package_name: str) -> List[str]:
-    """Validate a Python package structure and its imports."""
+def validate_python_package(package_path: Path, package_name: str,
+                            py_files: List[str], subdirs: List[str]) -> List[str]:
+    """Validate a Python package structure and its imports.
+
+    py_files and subdirs are the package's entries from scan_container.
+    """
     errors = []
+    # The root package directory is also one of subdirs; validate its
+    # __init__.py only once
+    seen = set()
 
     # Check for root __init__.py
     root_init = package_path / package_name / "__init__.py"
@@ -146,53 +223,100 @@ def validate_python_package(package_path: Path, package_name: str) -> List[str]:
         errors.append(f"Missing package __init__.py file at {root_init.relative_to(package_path)}")
     elif root_init.exists():
         # Validate __init__.py contents
+        seen.add(os.fspath(root_init))
         init_errors = validate_init_file(root_init)
         errors.extend(init_errors)
 
     # Check all Python subdirectories for __init__.py files
-    for py_dir in package_path.rglob("*"):
-        if py_dir.is_dir() and not should_skip_directory(py_dir):
-            init_file = py_dir / "__init__.py"
-            if not init_file.exists():
-                errors.append(f"Missing __init__.py in Python package directory: {py_dir.relative_to(package_path)}")
-            else:
-                # Validate __init__.py contents
-                init_errors = validate_init_file(init_file)
-                errors.extend(init_errors)
+    for py_dir in subdirs:
+        init_file = os.path.join(py_dir, "__init__.py")
+        if not os.path.exists(init_file):
+            errors.append(f"Missing __init__.py in Python package directory: {os.path.relpath(py_dir, package_path)}")
+        elif init_file not in seen:
+            # Validate __init__.py contents
+            seen.add(init_file)
+            init_errors = validate_init_file(Path(init_file))
+            errors.extend(init_errors)
 
     # Check for relative imports in Python files
-    for py_file in package_path.rglob("*.py"):
-        if py_file.name != "__init__.py" and not should_skip_directory(py_file.parent):
-            import_errors = validate_imports(py_file, package_path)
+    for py_file in py_files:
+        if not py_file.endswith(_INIT_SUFFIX):
+            import_errors = validate_imports(Path(py_file), package_path)
             errors.extend(import_errors)
 
     return errors
 
+# Node types that can hold an ImportFrom or Assign: statements, plus the
+# except/case clauses whose bodies are statement lists
+_BLOCK_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+def _summarize_tree(tree: ast.AST) -> _ast_cache.SourceSummary:
+    """Extract the findings validate_init_file and validate_imports consume.
+
+    Walks statements only, with an explicit stack in source order; expression
+    subtrees can't contain imports or assignments, so they are never entered.
+    """
+    has_all = False
+    has_importfrom = False
+    import_findings = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.ImportFrom):
+            has_importfrom = True
+            # Check for relative imports and non-standardized internal imports
+            if node.level > 0:
+                import_findings.append((node.level, node.module or ''))
+            # Check for imports that start with 'containers.' which is now deprecated
+            elif node.module and node.module.startswith('containers.'):
+                import_findings.append((0, node.module))
+            continue
+        # Check for __all__ definition
+        if isinstance(node, ast.Assign):
+            if not has_all:
+                has_all = any(t.id == "__all__" for t in node.targets if isinstance(t, ast.Name))
+            continue
+
+        children = []
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                children.extend(child for child in value if isinstance(child, _BLOCK_NODES))
+        children.reverse()
+        stack.extend(children)
+
+    return _ast_cache.SourceSummary(has_all, has_importfrom, tuple(import_findings))
+
+def summarize_source(py_file: Path) -> _ast_cache.SourceSummary:
+    """Return the AST findings for a Python file, parsing only on a cache miss.
+
+    The file is read once as bytes and hashed before decoding, so a hit never
+    decodes it. Raises OSError if the file can't be read, UnicodeDecodeError
+    if it isn't UTF-8 and SyntaxError if it can't be parsed; none of these
+    are cached.
+    """
+    data = py_file.read_bytes()
+
+    path = os.path.abspath(py_file)
+    sha = hashlib.sha256(data).digest()
+    summary = _ast_cache.lookup(path, sha)
+    if summary is None:
+        content = data.decode('utf-8')
+        tree = compile(content, path, 'exec', flags=ast.PyCF_ONLY_AST, optimize=2)
+        summary = _summarize_tree(tree)
+        _ast_cache.store(path, sha, summary)
+    return summary
+
 def validate_init_file(init_file: Path) -> List[str]:
     """Validate the contents of an __init__.py file."""
     errors = []
     try:
-        with open(init_file, 'r') as f:
-            content = f.read()
-
-        # Parse the file
-        try:
-            tree = ast.parse(content)
+        summary = summarize_source(init_file)
+        if not summary.has_all and summary.has_importfrom:
+            errors.append(f"Missing __all__ definition in {init_file} when it contains imports")
 
-            # Check for __all__ definition
-            has_all = any(
-                isinstance(node, ast.Assign) and
-                any(t.id == "__all__" for t in node.targets if isinstance(t, ast.Name))
-                for node in ast.walk(tree)
-            )
-
-            if not has_all and any(
-                isinstance(node, ast.ImportFrom) for node in ast.walk(tree)
-            ):
-                errors.append(f"Missing __all__ definition in {init_file} when it contains imports")
-
-        except SyntaxError as e:
-            errors.append(f"Syntax error in {init_file}: {str(e)}")
+    except SyntaxError as e:
+        errors.append(f"Syntax error in {init_file}: {str(e)}")
 
     except Exception as e:
         errors.append(f"Error reading {init_file}: {str(e)}")
@@ -203,24 +327,15 @@ def validate_imports(py_file: Path, package_path: Path) -> List[str]:
     """Validate imports in a Python file."""
     errors = []
     try:
-        with open(py_file, 'r') as f:
-            content = f.read()
-
-        # Parse the file
-        try:
-            tree = ast.parse(content)
-
-            # Check for relative imports and non-standardized internal imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom):
-                    if node.level > 0:
-                        errors.append(f"Relative import found in {py_file}: from {'.' * node.level}{node.module or ''} import ...")
-                    # Check for imports that start with 'containers.' which is now deprecated
-                    elif node.module and node.module.startswith('containers.'):
-                        errors.append(f"Deprecated import format in {py_file}: from {node.module} import ... (should start with the container name directly, e.g., 'foundation.' instead of 'containers.foundation.')")
+        summary = summarize_source(py_file)
+        for level, module in summary.import_findings:
+            if level > 0:
+                errors.append(f"Relative import found in {py_file}: from {'.' * level}{module} import ...")
+            else:
+                errors.append(f"Deprecated import format in {py_file}: from {module} import ... (should start with the container name directly, e.g., 'foundation.' instead of 'containers.foundation.')")
 
-        except SyntaxError as e:
-            errors.append(f"Syntax error in {py_file}: {str(e)}")
+    except SyntaxError as e:
+        errors.append(f"Syntax error in {py_file}: {str(e)}")
 
     except Exception as e:
         errors.append(f"Error reading {py_file}: {str(e)}")
@@ -229,37 +344,50 @@ def validate_imports(py_file: Path, package_path: Path) -> List[str]:
 
 def is_utility_container(container_name: str) -> bool:
     """Determine if a container is a utility container that may not need a Dockerfile."""
-    utility_containers = ['common', 'tools', 'monitoring', 'resource_monitor']
-    return container_name in utility_containers
+    return container_name in UTILITY_CONTAINERS
 
 def has_python_code(container_path: Path) -> bool:
     """Check if the container has Python code."""
-    python_files = list(container_path.glob("**/*.py"))
-    return len(python_files) > 0 and (container_path / "src").exists()
+    # Probe src first: a single stat, and no walk at all when it is missing
+    if not os.path.exists(os.path.join(container_path, "src")):
+        return False
+    py_files, _ = scan_container(container_path)
+    return bool(py_files)
 
 def main():
     """Run standalone validation if script is executed directly."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Validate container directory structure")
-    parser.add_argument("container", help="Path to the container directory to validate")
+    parser.add_argument("containers", nargs="+", metavar="container",
+                        help="Path(s) to the container directories to validate")
     args = parser.parse_args()
 
-    container_path = Path(args.container)
-    if not container_path.exists() or not container_path.is_dir():
-        logger.error(f"Container directory not found: {container_path}")
-        return 1
-
-    errors = validate_container_structure(container_path)
-
-    if errors:
-        logger.error("Container validation failed:")
-        for error in errors:
-            logger.error(f"  - {error}")
-        return 1
-    else:
-        logger.info("Container validation passed successfully!")
-        return 0
+    # Validate every container in this process so black, its Mode and the
+    # AST cache connection are set up once for the whole batch
+    exit_code = 0
+    for container in args.containers:
+        container_path = Path(container)
+        if not container_path.exists() or not container_path.is_dir():
+            logger.error(f"Container directory not found: {container_path}")
+            exit_code = 1
+            continue
+
+        # validate_container_structure itself stays silent so callers that
+        # run containers on threads can order its output themselves
+        if container_path.name not in EXCLUDED_DIRS and has_python_code(container_path):
+            logger.info("Formatting Python files with black...")
+        errors = validate_container_structure(container_path)
+
+        if errors:
+            logger.error(f"Container validation failed for {container_path}:")
+            for error in errors:
+                logger.error(f"  - {error}")
+            exit_code = 1
+        else:
+            logger.info(f"Container validation passed successfully for {container_path}!")
+
+    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -30,8 +30,9 @@ PROHIBITED_PATTERNS = [
     r'pip install(?!.*--no-cache-dir)',  # pip without --no-cache-dir
     r'COPY containers/',  # Absolute paths in COPY commands
 ]
+MULTISTAGE_PATTERN = r'FROM\s+\w+(?::\S+)?\s+[Aa][Ss]\s+\w+'
 SECURITY_CHECKS = [
-    (r'FROM\s+\w+(?::\S+)?\s+[Aa][Ss]\s+\w+', "Multi-stage builds recommended for smaller images"),
+    (MULTISTAGE_PATTERN, "Multi-stage builds recommended for smaller images"),
     (r'USER\s+(?!root)', "Using non-root user recommended for security"),
     (r'rm -rf /var/lib/apt/lists/\*', "Clean up apt cache to reduce image size"),
 ]
@@ -44,6 +45,58 @@ POETRY_CHECKS = [
     (r'poetry config virtualenvs.create false', "Poetry virtualenv configuration")
 ]
 
+def _scope(pattern: str) -> str:
+    """Name the instruction a check applies to: its leading keyword, else RUN."""
+    keyword = pattern.split(None, 1)[0].split('\\', 1)[0].upper()
+    return keyword if keyword in ('FROM', 'USER', 'COPY') else 'RUN'
+
+# Compiled once at import time, each paired with the instruction whose logical
+# lines it is matched against. The multi-stage pattern is compiled under its
+# own name and reused by its security check, wherever that sits in the list.
+_MULTISTAGE_RE = re.compile(MULTISTAGE_PATTERN, re.IGNORECASE)
+_PROHIBITED_RES = [
+    (pattern, re.compile(pattern, re.IGNORECASE), _scope(pattern))
+    for pattern in PROHIBITED_PATTERNS
+]
+_SECURITY_RES = [
+    (_MULTISTAGE_RE if pattern == MULTISTAGE_PATTERN else re.compile(pattern, re.IGNORECASE),
+     _scope(pattern), message)
+    for pattern, message in SECURITY_CHECKS
+]
+_POETRY_RES = [
+    (re.compile(pattern, re.IGNORECASE), _scope(pattern), description)
+    for pattern, description in POETRY_CHECKS
+]
+_POETRY_INSTALL_RE = re.compile(r'poetry install', re.IGNORECASE)
+
+def _parse_dockerfile(content: str) -> List[Tuple[str, str]]:
+    """Split a Dockerfile into (INSTRUCTION, arguments) logical lines.
+
+    Backslash-continued lines are joined and comment lines are dropped,
+    including those inside a continuation.
+    """
+    logical_lines = []
+    parts = []
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if stripped.endswith('\\'):
+            parts.append(stripped[:-1].strip())
+            continue
+        parts.append(stripped)
+        logical_lines.append(' '.join(parts))
+        parts = []
+    if parts:
+        logical_lines.append(' '.join(parts))
+
+    instructions = []
+    for logical_line in logical_lines:
+        # Any run of whitespace, tabs included, separates the instruction
+        fields = logical_line.split(None, 1)
+        instructions.append((fields[0].upper(), fields[1] if len(fields) > 1 else ''))
+    return instructions
+
 def validate_dockerfile(dockerfile_path: str) -> Tuple[List[str], List[str]]:
     """Validate a Dockerfile against project standards."""
     errors = []
@@ -59,24 +112,32 @@ def validate_dockerfile(dockerfile_path: str) -> Tuple[List[str], List[str]]:
     try:
         with open(dockerfile_path, 'r') as f:
             content = f.read()
-            lines = content.splitlines()
     except Exception as e:
         errors.append(f"Error reading Dockerfile: {e}")
         return errors, warnings
     
+    # Tokenize once; every check below is a lookup into these logical lines
+    instructions = _parse_dockerfile(content)
+    lines: Dict[str, List[str]] = {}
+    for instruction, args in instructions:
+        lines.setdefault(instruction, []).append(f"{instruction} {args}")
+
+    def search(regex: re.Pattern, instruction: str) -> bool:
+        return any(regex.search(line) for line in lines.get(instruction, ()))
+
     # Check for required instructions
     for instruction in REQUIRED_INSTRUCTIONS:
-        if not re.search(rf'^\s*{instruction}\s+', content, re.MULTILINE | re.IGNORECASE):
+        if instruction not in lines:
             errors.append(f"Missing required instruction: {instruction}")
     
     # Check for recommended instructions
     for instruction in RECOMMENDED_INSTRUCTIONS:
-        if not re.search(rf'^\s*{instruction}\s+', content, re.MULTILINE | re.IGNORECASE):
+        if instruction not in lines:
             warnings.append(f"Missing recommended instruction: {instruction}")
     
     # Check for prohibited patterns
-    for pattern in PROHIBITED_PATTERNS:
-        matches = re.findall(pattern, content, re.MULTILINE | re.IGNORECASE)
+    for pattern, regex, instruction in _PROHIBITED_RES:
+        matches = [m for line in lines.get(instruction, ()) for m in regex.findall(line)]
         if matches:
             if "containers/" in pattern:
                 errors.append(f"Found absolute path in COPY command. Use relative paths instead: {matches}")
@@ -84,52 +145,62 @@ def validate_dockerfile(dockerfile_path: str) -> Tuple[List[str], List[str]]:
                 errors.append(f"Found prohibited pattern: {pattern}")
     
     # Check for multi-stage build
-    is_multistage = bool(re.search(r'FROM\s+\w+(?::\S+)?\s+[Aa][Ss]\s+\w+', content, re.MULTILINE | re.IGNORECASE))
+    is_multistage = search(_MULTISTAGE_RE, 'FROM')
     
     # Security checks
-    for pattern, message in SECURITY_CHECKS:
-        if not re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
+    for regex, instruction, message in _SECURITY_RES:
+        if regex is _MULTISTAGE_RE:
+            found = is_multistage
+        else:
+            found = search(regex, instruction)
+        if not found:
             # Skip multi-stage build warning if we already have a multi-stage build
             if "Multi-stage builds" in message and is_multistage:
                 continue
             # Skip apt cache cleanup warning if we have rm -rf /var/lib/apt/lists/*
-            if "apt cache" in message and "rm -rf /var/lib/apt/lists/*" in content:
+            if "apt cache" in message and any("rm -rf /var/lib/apt/lists/*" in line for line in lines.get('RUN', ())):
                 continue
             warnings.append(f"Security recommendation: {message}")
     
-    # Poetry-specific validation
-    poetry_installation_found = False
-    poetry_config_found = False
-    poetry_usage_found = False
-    
-    for pattern, description in POETRY_CHECKS:
-        if re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
-            if "installation" in description.lower():
-                poetry_installation_found = True
-            elif "configuration" in description.lower():
-                poetry_config_found = True
-            elif "dependency" in description.lower():
-                poetry_usage_found = True
-    
-    # Check for Python-based container that should use Poetry
-    is_python_container = re.search(r'FROM\s+python', content, re.MULTILINE | re.IGNORECASE)
+    # Check for Python-based container that should use Poetry; the Poetry
+    # checks only matter for those, so skip them for every other base image
+    is_python_container = any(
+        args.lower().startswith('python') for instruction, args in instructions if instruction == 'FROM'
+    )
     if is_python_container:
+        # Poetry-specific validation
+        poetry_installation_found = False
+        poetry_config_found = False
+        poetry_usage_found = False
+        
+        for regex, instruction, description in _POETRY_RES:
+            if search(regex, instruction):
+                if "installation" in description.lower():
+                    poetry_installation_found = True
+                elif "configuration" in description.lower():
+                    poetry_config_found = True
+                elif "dependency" in description.lower():
+                    poetry_usage_found = True
+        
         if not poetry_installation_found:
             errors.append("Missing Poetry installation in Dockerfile")
             errors.append("Recommendation: Add 'RUN curl -sSL https://install.python-poetry.org | python3 -'")
         
-        if not poetry_usage_found and not re.search(r'poetry install', content, re.MULTILINE | re.IGNORECASE):
+        if not poetry_usage_found and not search(_POETRY_INSTALL_RE, 'RUN'):
             errors.append("Missing Poetry dependency installation in Dockerfile")
             errors.append("Recommendation: Add 'RUN poetry install --no-interaction'")
             
-        if "COPY pyproject.toml" not in content and "COPY [\"pyproject.toml" not in content:
+        if not any(line.startswith(("COPY pyproject.toml", "COPY [\"pyproject.toml")) for line in lines.get('COPY', ())):
             errors.append("Missing Poetry configuration file copy in Dockerfile")
             errors.append("Recommendation: Add 'COPY pyproject.toml poetry.lock* ./'")
     
     # Check for relative paths in COPY commands
-    copy_commands = re.findall(r'^\s*COPY\s+(.+?)\s+(.+?)$', content, re.MULTILINE)
-    for source, dest in copy_commands:
-        if 'containers/' in source:
+    for instruction, args in instructions:
+        if instruction != 'COPY':
+            continue
+        fields = args.split(None, 1)
+        if len(fields) == 2 and 'containers/' in fields[0]:
+            source, dest = fields
             errors.append(f"Use relative paths in COPY commands: {source} -> {dest}")
             errors.append(f"Recommendation: Change to 'COPY {source.split('/')[-1]} {dest}'")
     
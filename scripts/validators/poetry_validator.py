@@ -11,8 +11,13 @@ Usage:
 
 import os
 import sys
-import tomli
+import functools
 import argparse
+
+try:
+    import tomllib as tomli
+except ImportError:  # Python < 3.11
+    import tomli
 from pathlib import Path
 
 REQUIRED_SECTIONS = ["tool.poetry", "tool.poetry.dependencies"]
@@ -20,31 +25,47 @@ REQUIRED_DEV_SECTIONS = ["tool.poetry.group.dev.dependencies"]
 REQUIRED_FIELDS = ["name", "version", "description"]
 
 
-def validate_poetry_config(container_path):
-    """Validate poetry configuration for a container."""
+@functools.lru_cache(maxsize=256)
+def _load_pyproject(path, mtime_ns, size):
+    """Parse a pyproject.toml; keyed on stat fields so edits invalidate it."""
+    with open(path, "rb") as f:
+        return tomli.load(f)
+
+
+def load_pyproject(pyproject_path):
+    """Return the parsed pyproject.toml, reusing an earlier parse if unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(pyproject_path)
+    return _load_pyproject(os.fspath(pyproject_path), st.st_mtime_ns, st.st_size)
+
+
+def check_poetry_config(container_path):
+    """Validate poetry configuration for a container.
+
+    Returns (valid, message) without printing, so callers running several
+    containers at once can report the message in their own order.
+    """
     pyproject_path = Path(container_path) / "pyproject.toml"
     
     # Check if pyproject.toml exists
     if not pyproject_path.exists():
-        print(f"❌ Error: {pyproject_path} does not exist")
-        return False
+        return False, f"❌ Error: {pyproject_path} does not exist"
     
     # Check for requirements.txt or setup.py (should not exist)
     requirements_path = Path(container_path) / "requirements.txt"
     setup_path = Path(container_path) / "setup.py"
     
     if requirements_path.exists():
-        print(f"❌ Error: {requirements_path} exists (should use pyproject.toml instead)")
-        return False
+        return False, f"❌ Error: {requirements_path} exists (should use pyproject.toml instead)"
         
     if setup_path.exists():
-        print(f"❌ Error: {setup_path} exists (should use pyproject.toml instead)")
-        return False
+        return False, f"❌ Error: {setup_path} exists (should use pyproject.toml instead)"
     
     # Parse and validate pyproject.toml
     try:
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomli.load(f)
+        pyproject_data = load_pyproject(pyproject_path)
         
         # Check required sections
         for section in REQUIRED_SECTIONS:
@@ -52,28 +73,30 @@ def validate_poetry_config(container_path):
             current = pyproject_data
             for part in parts:
                 if part not in current:
-                    print(f"❌ Error: Missing section '{section}' in pyproject.toml")
-                    return False
+                    return False, f"❌ Error: Missing section '{section}' in pyproject.toml"
                 current = current[part]
         
         # Check required fields in [tool.poetry]
         poetry_section = pyproject_data.get("tool", {}).get("poetry", {})
         for field in REQUIRED_FIELDS:
             if field not in poetry_section:
-                print(f"❌ Error: Missing required field '{field}' in [tool.poetry]")
-                return False
+                return False, f"❌ Error: Missing required field '{field}' in [tool.poetry]"
         
         # Check Python version constraint
         if "python" not in pyproject_data.get("tool", {}).get("poetry", {}).get("dependencies", {}):
-            print("❌ Error: Missing Python version constraint in dependencies")
-            return False
+            return False, "❌ Error: Missing Python version constraint in dependencies"
             
-        print(f"✅ Poetry configuration valid: {pyproject_path}")
-        return True
+        return True, f"✅ Poetry configuration valid: {pyproject_path}"
         
     except Exception as e:
-        print(f"❌ Error parsing pyproject.toml: {e}")
-        return False
+        return False, f"❌ Error parsing pyproject.toml: {e}"
+
+
+def validate_poetry_config(container_path):
+    """Validate poetry configuration for a container, printing the result."""
+    valid, message = check_poetry_config(container_path)
+    print(message)
+    return valid
 
 
 def main():
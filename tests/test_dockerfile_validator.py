@@ -0,0 +1,48 @@
+"""Tests for scripts/validators/dockerfile_validator.py."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "validators"))
+
+from dockerfile_validator import _parse_dockerfile, validate_dockerfile
+
+
+TAB_SEPARATED_DOCKERFILE = (
+    "FROM\tpython:3.11\n"
+    "WORKDIR\t/app\n"
+    "COPY\tcontainers/app/src\t./src\n"
+    "RUN\tpip install foo\n"
+    "USER\tapp\n"
+    "CMD\t[\"python\", \"-m\", \"app\"]\n"
+)
+
+
+class ParseDockerfileTest(unittest.TestCase):
+    def test_tab_separates_instruction_from_arguments(self):
+        self.assertEqual(
+            _parse_dockerfile("RUN\tcurl -sSL https://example.com\nUSER\n"),
+            [("RUN", "curl -sSL https://example.com"), ("USER", "")]
+        )
+
+
+class ValidateDockerfileTest(unittest.TestCase):
+    def validate(self, content):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "Dockerfile"
+            path.write_text(content)
+            return validate_dockerfile(str(path))
+
+    def test_tab_separated_instructions_are_checked(self):
+        errors, warnings = self.validate(TAB_SEPARATED_DOCKERFILE)
+
+        self.assertFalse([e for e in errors if e.startswith("Missing required instruction")])
+        self.assertIn("Found prohibited pattern: pip install(?!.*--no-cache-dir)", errors)
+        self.assertIn("Use relative paths in COPY commands: containers/app/src -> ./src", errors)
+        self.assertNotIn("Security recommendation: Using non-root user recommended for security", warnings)
+
+
+if __name__ == "__main__":
+    unittest.main()